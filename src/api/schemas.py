@@ -6,86 +6,116 @@ These schemas provide:
 - Automatic OpenAPI documentation
 - Response serialization
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+from typing import List, Optional
+
+
+# ========== BASE SCHEMA ==========
+
+class CamelModel(BaseModel):
+    """
+    Base schema exposing snake_case fields under camelCase JSON names.
+    
+    Aliases come from a model-wide generator instead of per-field
+    Field(alias=...) declarations; fields can be populated by either name.
+    """
+    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
 
 # ========== LOCATION SCHEMAS ==========
 
-class LocationResponse(BaseModel):
+class LocationResponse(CamelModel):
     """Geographic location response."""
     lat: float = Field(..., description="Latitude in degrees")
-    long: float = Field(..., description="Longitude in degrees", alias="lng")
-    
-    class Config:
-        populate_by_name = True
+    lng: float = Field(..., description="Longitude in degrees")
 
 
 # ========== WAREHOUSE SCHEMAS ==========
 
-class WarehouseLocationResponse(BaseModel):
+class WarehouseLocationResponse(CamelModel):
     """Warehouse location with ID."""
-    warehouseId: int = Field(..., description="Unique warehouse identifier")
-    warehouseLocation: LocationResponse = Field(..., description="Warehouse coordinates")
+    warehouse_id: int = Field(..., description="Unique warehouse identifier")
+    warehouse_location: LocationResponse = Field(..., description="Warehouse coordinates")
 
 
-class NearestWarehouseResponse(BaseModel):
+class NearestWarehouseResponse(CamelModel):
     """Response for nearest warehouse lookup."""
-    warehouseId: int = Field(..., description="Nearest warehouse ID")
-    warehouseLocation: LocationResponse = Field(..., description="Warehouse coordinates")
-    distanceKm: Optional[float] = Field(None, description="Distance from seller in km")
-    warehouseName: Optional[str] = Field(None, description="Warehouse name")
+    warehouse_id: int = Field(..., description="Nearest warehouse ID")
+    warehouse_location: LocationResponse = Field(..., description="Warehouse coordinates")
+    distance_km: Optional[float] = Field(None, description="Distance from seller in km")
+    warehouse_name: Optional[str] = Field(None, description="Warehouse name")
 
 
 # ========== DELIVERY COST SCHEMAS ==========
 
-class DeliveryCostBreakdown(BaseModel):
+class DeliveryCostBreakdown(CamelModel):
     """Delivery speed cost breakdown."""
-    baseCharge: float = Field(..., description="Base courier charge in INR")
-    extraCharge: float = Field(..., description="Extra charge for express delivery")
+    base_charge: float = Field(..., description="Base courier charge in INR")
+    extra_charge: float = Field(..., description="Extra charge for express delivery")
     total: float = Field(..., description="Total delivery cost")
     speed: str = Field(..., description="Delivery speed (standard/express)")
 
 
 # ========== SHIPPING CHARGE SCHEMAS ==========
 
-class ShippingBreakdown(BaseModel):
+class ShippingBreakdown(CamelModel):
     """Detailed shipping cost breakdown."""
-    distanceKm: float = Field(..., description="Distance in kilometers")
-    transportMode: str = Field(..., description="Transport mode used")
-    transportCost: float = Field(..., description="Transport cost in INR")
-    deliveryCost: DeliveryCostBreakdown = Field(..., description="Delivery speed costs")
-    weightKg: float = Field(..., description="Product weight in kg")
+    distance_km: float = Field(..., description="Distance in kilometers")
+    transport_mode: str = Field(..., description="Transport mode used")
+    transport_cost: float = Field(..., description="Transport cost in INR")
+    delivery_cost: DeliveryCostBreakdown = Field(..., description="Delivery speed costs")
+    weight_kg: float = Field(..., description="Product weight in kg")
 
 
-class ShippingChargeResponse(BaseModel):
+class ShippingChargeResponse(CamelModel):
     """Response for shipping charge calculation."""
-    shippingCharge: float = Field(..., description="Total shipping charge in INR")
+    shipping_charge: float = Field(..., description="Total shipping charge in INR")
     breakdown: Optional[ShippingBreakdown] = Field(None, description="Cost breakdown")
 
 
-class CalculateShippingRequest(BaseModel):
+class CalculateShippingRequest(CamelModel):
     """Request body for total shipping calculation."""
-    sellerId: int = Field(..., description="Seller's unique identifier")
-    customerId: int = Field(..., description="Customer's unique identifier")
-    productId: int = Field(..., description="Product's unique identifier")
-    deliverySpeed: str = Field(
+    seller_id: int = Field(..., description="Seller's unique identifier")
+    customer_id: int = Field(..., description="Customer's unique identifier")
+    product_id: int = Field(..., description="Product's unique identifier")
+    delivery_speed: str = Field(
         "standard",
         description="Delivery speed: 'standard' or 'express'"
     )
 
 
-class TotalShippingResponse(BaseModel):
+class TotalShippingResponse(CamelModel):
     """Response for total shipping calculation."""
-    shippingCharge: float = Field(..., description="Total shipping charge in INR")
-    nearestWarehouse: WarehouseLocationResponse = Field(..., description="Selected warehouse")
+    shipping_charge: float = Field(..., description="Total shipping charge in INR")
+    nearest_warehouse: WarehouseLocationResponse = Field(..., description="Selected warehouse")
     breakdown: Optional[ShippingBreakdown] = Field(None, description="Detailed cost breakdown")
 
 
+# ========== BATCH SCHEMAS ==========
+
+class BatchShippingRequest(CamelModel):
+    """Request body for batch shipping calculation."""
+    items: List[CalculateShippingRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Rows to price, each like a single calculate request"
+    )
+
+
+class BatchShippingResponse(CamelModel):
+    """Response for batch shipping calculation."""
+    results: List[TotalShippingResponse] = Field(
+        ...,
+        description="One result per request item, in request order"
+    )
+
+
 # ========== ERROR SCHEMAS ==========
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(CamelModel):
     """Standard error response."""
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
-    statusCode: int = Field(..., description="HTTP status code")
+    status_code: int = Field(..., description="HTTP status code")
@@ -1,25 +1,57 @@
 """
 Shipping charge API routes.
 """
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Response
+from pydantic import TypeAdapter
 from src.api.schemas import (
     ShippingChargeResponse,
-    ShippingBreakdown,
-    DeliveryCostBreakdown,
     CalculateShippingRequest,
     TotalShippingResponse,
-    WarehouseLocationResponse,
-    LocationResponse
+    BatchShippingRequest,
+    BatchShippingResponse
 )
+from src.api.validation import require_positive_id
 from src.core.dependencies import get_services, Services
+from src.core.responses import ORJSONResponse
+from src.services.batch_shipping import BatchShippingResult
+from src.services.shipping_charge_service import ShippingChargeResult
 
 
 router = APIRouter(prefix="/shipping-charge", tags=["Shipping"])
 
+# Adapters built once at import time; validate_python and dump_json run in pydantic-core
+_SHIPPING_ADAPTER = TypeAdapter(ShippingChargeResponse)
+_TOTAL_ADAPTER = TypeAdapter(TotalShippingResponse)
+_BATCH_ADAPTER = TypeAdapter(BatchShippingResponse)
+
+
+def _breakdown_data(result: ShippingChargeResult) -> dict:
+    """
+    Map a service result onto the ShippingBreakdown schema fields.
+    
+    The nested plain dict lets pydantic-core validate the whole response
+    in one pass instead of one Python __init__ per nested model. Services
+    return unrounded amounts; they are rounded to 2 decimals here.
+    """
+    delivery_cost = result.delivery_cost
+    return {
+        "distance_km": round(result.distance_km, 2),
+        "transport_mode": result.transport_mode,
+        "transport_cost": round(result.transport_cost, 2),
+        "delivery_cost": {
+            "base_charge": delivery_cost.base_charge,
+            "extra_charge": round(delivery_cost.extra_charge, 2),
+            "total": round(delivery_cost.total, 2),
+            "speed": delivery_cost.speed
+        },
+        "weight_kg": result.weight_kg
+    }
+
 
 @router.get(
     "",
-    response_model=ShippingChargeResponse,
+    responses={200: {"model": ShippingChargeResponse}},
+    response_class=ORJSONResponse,
     summary="Get Shipping Charge From Warehouse",
     description="""
     Calculate shipping charge from a specific warehouse to a customer.
@@ -35,20 +67,17 @@ async def get_shipping_charge(
     warehouse_id: int = Query(
         ...,
         alias="warehouseId",
-        description="Warehouse's unique identifier",
-        ge=1
+        description="Warehouse's unique identifier"
     ),
     customer_id: int = Query(
         ...,
         alias="customerId",
-        description="Customer's unique identifier",
-        ge=1
+        description="Customer's unique identifier"
     ),
     product_id: int = Query(
         ...,
         alias="productId",
-        description="Product's unique identifier",
-        ge=1
+        description="Product's unique identifier"
     ),
     delivery_speed: str = Query(
         "standard",
@@ -56,7 +85,7 @@ async def get_shipping_charge(
         description="Delivery speed: 'standard' or 'express'"
     ),
     services: Services = Depends(get_services)
-) -> ShippingChargeResponse:
+) -> Response:
     """
     Calculate shipping charge from warehouse to customer.
     
@@ -68,8 +97,13 @@ async def get_shipping_charge(
         services: Injected services container
         
     Returns:
-        ShippingChargeResponse with charge and breakdown
+        ShippingChargeResponse with charge and breakdown, already serialized
+        so FastAPI does not validate it a second time
     """
+    require_positive_id(warehouse_id, "warehouseId")
+    require_positive_id(customer_id, "customerId")
+    require_positive_id(product_id, "productId")
+    
     result = services.shipping_charge.calculate_from_warehouse(
         warehouse_id=warehouse_id,
         customer_id=customer_id,
@@ -77,26 +111,21 @@ async def get_shipping_charge(
         delivery_speed=delivery_speed
     )
     
-    return ShippingChargeResponse(
-        shippingCharge=result.shipping_charge,
-        breakdown=ShippingBreakdown(
-            distanceKm=result.distance_km,
-            transportMode=result.transport_mode,
-            transportCost=result.transport_cost,
-            deliveryCost=DeliveryCostBreakdown(
-                baseCharge=result.delivery_cost.base_charge,
-                extraCharge=result.delivery_cost.extra_charge,
-                total=result.delivery_cost.total,
-                speed=result.delivery_cost.speed
-            ),
-            weightKg=result.weight_kg
-        )
+    response = _SHIPPING_ADAPTER.validate_python({
+        "shipping_charge": result.shipping_charge,
+        "breakdown": _breakdown_data(result)
+    })
+    
+    return Response(
+        content=_SHIPPING_ADAPTER.dump_json(response, by_alias=True, exclude_none=True),
+        media_type="application/json"
     )
 
 
 @router.post(
     "/calculate",
-    response_model=TotalShippingResponse,
+    responses={200: {"model": TotalShippingResponse}},
+    response_class=ORJSONResponse,
     summary="Calculate Total Shipping Charge",
     description="""
     Calculate complete shipping charge from seller to customer.
@@ -110,7 +139,7 @@ async def get_shipping_charge(
 async def calculate_total_shipping(
     request: CalculateShippingRequest,
     services: Services = Depends(get_services)
-) -> TotalShippingResponse:
+) -> Response:
     """
     Calculate total shipping charge including warehouse selection.
     
@@ -119,36 +148,124 @@ async def calculate_total_shipping(
         services: Injected services container
         
     Returns:
-        TotalShippingResponse with charge and warehouse info
+        TotalShippingResponse with charge and warehouse info, already serialized
+        so FastAPI does not validate it a second time
     """
     result = services.shipping_charge.calculate_total(
-        seller_id=request.sellerId,
-        customer_id=request.customerId,
-        product_id=request.productId,
-        delivery_speed=request.deliverySpeed
+        seller_id=request.seller_id,
+        customer_id=request.customer_id,
+        product_id=request.product_id,
+        delivery_speed=request.delivery_speed
     )
     
-    breakdown = result.breakdown
-    
-    return TotalShippingResponse(
-        shippingCharge=result.shipping_charge,
-        nearestWarehouse=WarehouseLocationResponse(
-            warehouseId=result.nearest_warehouse.warehouse_id,
-            warehouseLocation=LocationResponse(
-                lat=result.nearest_warehouse.location.lat,
-                lng=result.nearest_warehouse.location.lng
-            )
-        ),
-        breakdown=ShippingBreakdown(
-            distanceKm=breakdown.distance_km,
-            transportMode=breakdown.transport_mode,
-            transportCost=breakdown.transport_cost,
-            deliveryCost=DeliveryCostBreakdown(
-                baseCharge=breakdown.delivery_cost.base_charge,
-                extraCharge=breakdown.delivery_cost.extra_charge,
-                total=breakdown.delivery_cost.total,
-                speed=breakdown.delivery_cost.speed
-            ),
-            weightKg=breakdown.weight_kg
+    warehouse = result.nearest_warehouse
+    
+    response = _TOTAL_ADAPTER.validate_python({
+        "shipping_charge": result.shipping_charge,
+        "nearest_warehouse": {
+            "warehouse_id": warehouse.warehouse_id,
+            "warehouse_location": {
+                "lat": warehouse.location.lat,
+                "lng": warehouse.location.lng
+            }
+        },
+        "breakdown": _breakdown_data(result.breakdown)
+    })
+    
+    return Response(
+        content=_TOTAL_ADAPTER.dump_json(response, by_alias=True, exclude_none=True),
+        media_type="application/json"
+    )
+
+
+def _batch_results_data(result: BatchShippingResult) -> list:
+    """
+    Map a batch result onto a list of TotalShippingResponse fields.
+    
+    Amounts are rounded to 2 decimals here, as in _breakdown_data.
+    """
+    return [
+        {
+            "shipping_charge": shipping_charge,
+            "nearest_warehouse": {
+                "warehouse_id": warehouse.warehouse_id,
+                "warehouse_location": {
+                    "lat": warehouse.location.lat,
+                    "lng": warehouse.location.lng
+                }
+            },
+            "breakdown": {
+                "distance_km": round(distance_km, 2),
+                "transport_mode": transport_mode,
+                "transport_cost": round(transport_cost, 2),
+                "delivery_cost": {
+                    "base_charge": delivery_cost.base_charge,
+                    "extra_charge": round(delivery_cost.extra_charge, 2),
+                    "total": round(delivery_cost.total, 2),
+                    "speed": delivery_cost.speed
+                },
+                "weight_kg": weight_kg
+            }
+        }
+        for (
+            warehouse, distance_km, transport_mode, transport_cost,
+            weight_kg, delivery_cost, shipping_charge
+        ) in zip(
+            result.nearest_warehouses,
+            result.distances_km,
+            result.transport_modes,
+            result.transport_costs,
+            result.weights_kg,
+            result.delivery_costs,
+            result.shipping_charges
         )
+    ]
+
+
+@router.post(
+    "/batch",
+    responses={200: {"model": BatchShippingResponse}},
+    response_class=ORJSONResponse,
+    summary="Calculate Shipping Charges In Bulk",
+    description="""
+    Calculate total shipping charges for many rows in a single call.
+    
+    Each item is priced exactly like POST /shipping-charge/calculate; the
+    distance and transport cost math runs vectorized over all items at
+    once. Results are returned in request order.
+    """
+)
+def calculate_batch_shipping(
+    request: BatchShippingRequest,
+    services: Services = Depends(get_services)
+) -> Response:
+    """
+    Calculate total shipping charges for every item in the request.
+    
+    A plain def, so FastAPI runs it in its threadpool and a large batch
+    does not block the event loop.
+    
+    Args:
+        request: The items to price
+        services: Injected services container
+        
+    Returns:
+        BatchShippingResponse with one result per item, already serialized
+        so FastAPI does not validate it a second time
+    """
+    items = request.items
+    result = services.batch_shipping.calculate_total_batch(
+        seller_ids=[item.seller_id for item in items],
+        customer_ids=[item.customer_id for item in items],
+        product_ids=[item.product_id for item in items],
+        delivery_speeds=[item.delivery_speed for item in items]
+    )
+    
+    response = _BATCH_ADAPTER.validate_python({
+        "results": _batch_results_data(result)
+    })
+    
+    return Response(
+        content=_BATCH_ADAPTER.dump_json(response, by_alias=True, exclude_none=True),
+        media_type="application/json"
     )
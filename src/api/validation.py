@@ -0,0 +1,19 @@
+"""
+Lightweight request parameter checks for the API routes.
+"""
+from src.core.exceptions import ValidationError
+
+
+def require_positive_id(value: int, name: str) -> None:
+    """
+    Ensure an identifier parameter is at least 1.
+    
+    Args:
+        value: The identifier value
+        name: Parameter name as exposed by the API (used in the message)
+        
+    Raises:
+        ValidationError: If value is less than 1
+    """
+    if value < 1:
+        raise ValidationError(f"{name} must be >= 1, got {value}")
@@ -1,17 +1,24 @@
 """
 Warehouse API routes.
 """
-from fastapi import APIRouter, Query, Depends
-from src.api.schemas import NearestWarehouseResponse, LocationResponse
+from fastapi import APIRouter, Query, Depends, Response
+from pydantic import TypeAdapter
+from src.api.schemas import NearestWarehouseResponse
+from src.api.validation import require_positive_id
 from src.core.dependencies import get_services, Services
+from src.core.responses import ORJSONResponse
 
 
 router = APIRouter(prefix="/warehouse", tags=["Warehouse"])
 
+# Adapter built once at import time; validate_python and dump_json run in pydantic-core
+_NEAREST_ADAPTER = TypeAdapter(NearestWarehouseResponse)
+
 
 @router.get(
     "/nearest",
-    response_model=NearestWarehouseResponse,
+    responses={200: {"model": NearestWarehouseResponse}},
+    response_class=ORJSONResponse,
     summary="Get Nearest Warehouse",
     description="""
     Find the nearest warehouse to a seller's location.
@@ -26,17 +33,15 @@ async def get_nearest_warehouse(
     seller_id: int = Query(
         ...,
         alias="sellerId",
-        description="Seller's unique identifier",
-        ge=1
+        description="Seller's unique identifier"
     ),
     product_id: int = Query(
         ...,
         alias="productId",
-        description="Product's unique identifier (for context)",
-        ge=1
+        description="Product's unique identifier (for context)"
     ),
     services: Services = Depends(get_services)
-) -> NearestWarehouseResponse:
+) -> Response:
     """
     Get the nearest warehouse to a seller.
     
@@ -46,16 +51,25 @@ async def get_nearest_warehouse(
         services: Injected services container
         
     Returns:
-        NearestWarehouseResponse with warehouse details
+        NearestWarehouseResponse with warehouse details, already serialized
+        so FastAPI does not validate it a second time
     """
+    require_positive_id(seller_id, "sellerId")
+    require_positive_id(product_id, "productId")
+    
     warehouse, distance = services.warehouse.find_nearest_warehouse(seller_id)
     
-    return NearestWarehouseResponse(
-        warehouseId=warehouse.warehouse_id,
-        warehouseLocation=LocationResponse(
-            lat=warehouse.location.lat,
-            lng=warehouse.location.lng
-        ),
-        distanceKm=distance,
-        warehouseName=warehouse.name
+    response = _NEAREST_ADAPTER.validate_python({
+        "warehouse_id": warehouse.warehouse_id,
+        "warehouse_location": {
+            "lat": warehouse.location.lat,
+            "lng": warehouse.location.lng
+        },
+        "distance_km": round(distance, 2),
+        "warehouse_name": warehouse.name
+    })
+    
+    return Response(
+        content=_NEAREST_ADAPTER.dump_json(response, by_alias=True, exclude_none=True),
+        media_type="application/json"
     )
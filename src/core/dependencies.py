@@ -14,6 +14,7 @@ from src.repositories import (
 )
 from src.services.warehouse_service import WarehouseService
 from src.services.shipping_charge_service import ShippingChargeService
+from src.services.batch_shipping import BatchShippingService
 from src.strategies.factory import ShippingStrategyFactory
 from src.data.seed import seed_data
 
@@ -32,74 +33,76 @@ class Services:
     """Container for all service instances."""
     warehouse: WarehouseService
     shipping_charge: ShippingChargeService
+    batch_shipping: BatchShippingService
 
 
-# Singleton instances
-_repositories: Repositories | None = None
-_services: Services | None = None
-
-
+@lru_cache(maxsize=1)
 def get_repositories() -> Repositories:
     """
     Get the singleton Repositories instance.
     
-    Initializes repositories and seeds data on first call.
+    Initializes repositories and seeds data on first call; later calls
+    are served from the lru_cache.
     
     Returns:
         Repositories container with all repository instances
     """
-    global _repositories
-    
-    if _repositories is None:
-        _repositories = Repositories(
-            customer=CustomerRepository(),
-            seller=SellerRepository(),
-            product=ProductRepository(),
-            warehouse=WarehouseRepository()
-        )
-        # Seed initial data
-        seed_data(_repositories)
+    repositories = Repositories(
+        customer=CustomerRepository(),
+        seller=SellerRepository(),
+        product=ProductRepository(),
+        warehouse=WarehouseRepository()
+    )
+    # Seed initial data
+    seed_data(repositories)
     
-    return _repositories
+    return repositories
 
 
+@lru_cache(maxsize=1)
 def get_services() -> Services:
     """
     Get the singleton Services instance.
     
-    Initializes services on first call.
+    Initializes services on first call; later calls are served from
+    the lru_cache.
     
     Returns:
         Services container with all service instances
     """
-    global _services
+    repos = get_repositories()
+    
+    warehouse_service = WarehouseService(
+        warehouse_repo=repos.warehouse,
+        seller_repo=repos.seller
+    )
+    
+    strategy_factory = ShippingStrategyFactory()
+    
+    shipping_charge_service = ShippingChargeService(
+        warehouse_repo=repos.warehouse,
+        customer_repo=repos.customer,
+        product_repo=repos.product,
+        warehouse_service=warehouse_service,
+        strategy_factory=strategy_factory
+    )
     
-    if _services is None:
-        repos = get_repositories()
-        
-        warehouse_service = WarehouseService(
-            warehouse_repo=repos.warehouse,
-            seller_repo=repos.seller
-        )
-        
-        shipping_charge_service = ShippingChargeService(
-            warehouse_repo=repos.warehouse,
-            customer_repo=repos.customer,
-            product_repo=repos.product,
-            warehouse_service=warehouse_service,
-            strategy_factory=ShippingStrategyFactory()
-        )
-        
-        _services = Services(
-            warehouse=warehouse_service,
-            shipping_charge=shipping_charge_service
-        )
+    batch_shipping_service = BatchShippingService(
+        customer_repo=repos.customer,
+        product_repo=repos.product,
+        warehouse_service=warehouse_service,
+        shipping_charge_service=shipping_charge_service,
+        strategy_factory=strategy_factory
+    )
     
-    return _services
+    return Services(
+        warehouse=warehouse_service,
+        shipping_charge=shipping_charge_service,
+        batch_shipping=batch_shipping_service
+    )
 
 
 def reset_dependencies() -> None:
     """Reset all singleton instances. Useful for testing."""
-    global _repositories, _services
-    _repositories = None
-    _services = None
+    get_repositories.cache_clear()
+    get_services.cache_clear()
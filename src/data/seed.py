@@ -48,8 +48,7 @@ def seed_data(repositories) -> None:
         ),
     ]
     
-    for warehouse in warehouses:
-        repositories.warehouse.add(warehouse)
+    repositories.warehouse.bulk_add(warehouses)
     
     # ========== SELLERS (Kirana Stores) ==========
     sellers = [
@@ -80,8 +79,7 @@ def seed_data(repositories) -> None:
         ),
     ]
     
-    for seller in sellers:
-        repositories.seller.add(seller)
+    repositories.seller.bulk_add(sellers)
     
     # ========== CUSTOMERS ==========
     customers = [
@@ -117,8 +115,7 @@ def seed_data(repositories) -> None:
         ),
     ]
     
-    for customer in customers:
-        repositories.customer.add(customer)
+    repositories.customer.bulk_add(customers)
     
     # ========== PRODUCTS ==========
     products = [
@@ -159,5 +156,4 @@ def seed_data(repositories) -> None:
         ),
     ]
     
-    for product in products:
-        repositories.product.add(product)
+    repositories.product.bulk_add(products)
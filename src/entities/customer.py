@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.entities.location import Location
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Customer:
     """
     Represents a customer (buyer) in the B2B marketplace.
@@ -20,12 +20,3 @@ class Customer:
     name: str
     phone: str
     location: Location
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        return {
-            "customerId": self.customer_id,
-            "name": self.name,
-            "phone": self.phone,
-            "location": self.location.to_dict()
-        }
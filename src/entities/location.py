@@ -1,10 +1,11 @@
 """
 Location entity representing geographic coordinates.
 """
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     Represents a geographic location with latitude and longitude.
@@ -12,9 +13,15 @@ class Location:
     Attributes:
         lat: Latitude in degrees (-90 to 90)
         lng: Longitude in degrees (-180 to 180)
+        lat_rad: Latitude in radians (derived)
+        lng_rad: Longitude in radians (derived)
+        cos_lat: Cosine of the latitude (derived)
     """
     lat: float
     lng: float
+    lat_rad: float = field(init=False, repr=False, compare=False)
+    lng_rad: float = field(init=False, repr=False, compare=False)
+    cos_lat: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate coordinates are within valid ranges."""
@@ -22,7 +29,32 @@ class Location:
             raise ValueError(f"Latitude must be between -90 and 90, got {self.lat}")
         if not -180 <= self.lng <= 180:
             raise ValueError(f"Longitude must be between -180 and 180, got {self.lng}")
+        self._set_radians()
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        return {"lat": self.lat, "long": self.lng}
+    def _set_radians(self) -> None:
+        """Precompute the radian values used by distance calculations."""
+        lat_rad = math.radians(self.lat)
+        object.__setattr__(self, "lat_rad", lat_rad)
+        object.__setattr__(self, "lng_rad", math.radians(self.lng))
+        object.__setattr__(self, "cos_lat", math.cos(lat_rad))
+    
+    @classmethod
+    def unchecked(cls, lat: float, lng: float) -> "Location":
+        """
+        Create a Location without running the range validation.
+        
+        Only for coordinates that are already known to be valid, e.g. ones
+        copied from an existing Location.
+        
+        Args:
+            lat: Latitude in degrees
+            lng: Longitude in degrees
+            
+        Returns:
+            The new Location
+        """
+        location = object.__new__(cls)
+        object.__setattr__(location, "lat", lat)
+        object.__setattr__(location, "lng", lng)
+        location._set_radians()
+        return location
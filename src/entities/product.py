@@ -5,23 +5,15 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Dimensions:
     """Product dimensions in centimeters."""
     length: float
     width: float
     height: float
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        return {
-            "length": self.length,
-            "width": self.width,
-            "height": self.height
-        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """
     Represents a product in the marketplace.
@@ -45,15 +37,3 @@ class Product:
             raise ValueError(f"Price cannot be negative, got {self.price}")
         if self.weight_kg <= 0:
             raise ValueError(f"Weight must be positive, got {self.weight_kg}")
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        result = {
-            "productId": self.product_id,
-            "name": self.name,
-            "price": self.price,
-            "weightKg": self.weight_kg
-        }
-        if self.dimensions:
-            result["dimensions"] = self.dimensions.to_dict()
-        return result
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.entities.location import Location
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Seller:
     """
     Represents a seller (Kirana store) in the B2B marketplace.
@@ -18,11 +18,3 @@ class Seller:
     seller_id: int
     name: str
     location: Location
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        return {
-            "sellerId": self.seller_id,
-            "name": self.name,
-            "location": self.location.to_dict()
-        }
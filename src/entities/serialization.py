@@ -0,0 +1,117 @@
+"""
+JSON serialization for domain entities.
+
+Entities are encoded by orjson through a single ``default`` hook instead of
+per-entity ``to_dict`` methods. The hook only maps one object to its field
+dict; nested entities are handed back to orjson, so no intermediate dict
+tree is built up front.
+"""
+from typing import Any, Callable, Dict
+import orjson
+from src.entities.customer import Customer
+from src.entities.location import Location
+from src.entities.product import Dimensions, Product
+from src.entities.seller import Seller
+from src.entities.warehouse import Warehouse
+
+
+def _encode_location(location: Location) -> dict:
+    """Encode a Location."""
+    return {"lat": location.lat, "long": location.lng}
+
+
+def _encode_customer(customer: Customer) -> dict:
+    """Encode a Customer."""
+    return {
+        "customerId": customer.customer_id,
+        "name": customer.name,
+        "phone": customer.phone,
+        "location": customer.location
+    }
+
+
+def _encode_seller(seller: Seller) -> dict:
+    """Encode a Seller."""
+    return {
+        "sellerId": seller.seller_id,
+        "name": seller.name,
+        "location": seller.location
+    }
+
+
+def _encode_warehouse(warehouse: Warehouse) -> dict:
+    """Encode a Warehouse."""
+    return {
+        "warehouseId": warehouse.warehouse_id,
+        "warehouseLocation": warehouse.location,
+        "name": warehouse.name
+    }
+
+
+def _encode_dimensions(dimensions: Dimensions) -> dict:
+    """Encode product Dimensions."""
+    return {
+        "length": dimensions.length,
+        "width": dimensions.width,
+        "height": dimensions.height
+    }
+
+
+def _encode_product(product: Product) -> dict:
+    """Encode a Product."""
+    result = {
+        "productId": product.product_id,
+        "name": product.name,
+        "price": product.price,
+        "weightKg": product.weight_kg
+    }
+    if product.dimensions:
+        result["dimensions"] = product.dimensions
+    return result
+
+
+# Exact-type dispatch table (a dict probe instead of an isinstance chain)
+_ENCODERS: Dict[type, Callable[[Any], dict]] = {
+    Location: _encode_location,
+    Customer: _encode_customer,
+    Seller: _encode_seller,
+    Warehouse: _encode_warehouse,
+    Dimensions: _encode_dimensions,
+    Product: _encode_product,
+}
+
+
+def encode_entity(obj: Any) -> dict:
+    """
+    orjson ``default`` hook for domain entities.
+    
+    Args:
+        obj: The object orjson could not serialize natively
+        
+    Returns:
+        Dictionary with the entity's public (camelCase) fields
+        
+    Raises:
+        TypeError: If obj is not a known entity
+    """
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return encoder(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize entities (or containers of entities) to JSON bytes.
+    
+    Args:
+        obj: An entity, or a list/dict containing entities
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(
+        obj,
+        default=encode_entity,
+        option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.entities.location import Location
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Warehouse:
     """
     Represents a warehouse in the distribution network.
@@ -21,11 +21,3 @@ class Warehouse:
     warehouse_id: int
     location: Location
     name: str = ""
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
-        return {
-            "warehouseId": self.warehouse_id,
-            "warehouseLocation": self.location.to_dict(),
-            "name": self.name
-        }
@@ -2,13 +2,18 @@
 B2B E-Commerce Shipping Charge Estimator
 
 FastAPI application entry point.
+
+Run with ``uvicorn src.main:app`` or ``python -m src.main``. uvicorn's
+default "auto" loop and HTTP settings pick uvloop and httptools (both
+installed by uvicorn[standard]) wherever they are available, and fall
+back to asyncio on Windows.
 """
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api import warehouse_router, shipping_router
-from src.core.exceptions import ShippingError, NotFoundError, ValidationError
+from src.core.exceptions import ShippingError
+from src.core.responses import ORJSONResponse
 
 
 # Create FastAPI application
@@ -39,7 +44,8 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -55,39 +61,18 @@ app.add_middleware(
 
 # ========== EXCEPTION HANDLERS ==========
 
-@app.exception_handler(NotFoundError)
-async def not_found_handler(request: Request, exc: NotFoundError):
-    """Handle 404 Not Found errors."""
-    return JSONResponse(
-        status_code=404,
-        content={
-            "error": "NotFoundError",
-            "message": exc.message,
-            "statusCode": 404
-        }
-    )
-
-
-@app.exception_handler(ValidationError)
-async def validation_error_handler(request: Request, exc: ValidationError):
-    """Handle 400 Validation errors."""
-    return JSONResponse(
-        status_code=400,
-        content={
-            "error": "ValidationError",
-            "message": exc.message,
-            "statusCode": 400
-        }
-    )
-
-
 @app.exception_handler(ShippingError)
 async def shipping_error_handler(request: Request, exc: ShippingError):
-    """Handle generic shipping errors."""
-    return JSONResponse(
+    """
+    Handle all shipping errors.
+    
+    Subclasses carry their own HTTP status (e.g. NotFoundError -> 404,
+    ValidationError -> 400), so a single handler covers the whole hierarchy.
+    """
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
-            "error": "ShippingError",
+            "error": type(exc).__name__,
             "message": exc.message,
             "statusCode": exc.status_code
         }
@@ -97,7 +82,7 @@ async def shipping_error_handler(request: Request, exc: ShippingError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -134,3 +119,9 @@ async def health_check():
         "service": "shipping-charge-estimator",
         "version": "1.0.0"
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -1,7 +1,7 @@
 """
 Base repository with generic CRUD operations using in-memory storage.
 """
-from typing import TypeVar, Generic, Dict, Optional, List
+from typing import TypeVar, Generic, Dict, Iterable, Optional, List, ValuesView
 from abc import ABC, abstractmethod
 
 T = TypeVar('T')
@@ -13,10 +13,22 @@ class BaseRepository(ABC, Generic[T]):
     
     This pattern allows easy swapping to a database implementation later
     by changing the storage mechanism while keeping the interface the same.
+    
+    Entities are stored in a dict keyed by ID, so get_by_id, exists and
+    delete are O(1) hash lookups; implementations must keep that guarantee.
+    
+    Every mutation bumps a version counter, so callers can cache values
+    derived from the store and detect when they have gone stale.
     """
     
     def __init__(self):
         self._store: Dict[int, T] = {}
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the store is mutated."""
+        return self._version
     
     @abstractmethod
     def _get_id(self, entity: T) -> int:
@@ -35,8 +47,20 @@ class BaseRepository(ABC, Generic[T]):
         """
         entity_id = self._get_id(entity)
         self._store[entity_id] = entity
+        self._version += 1
         return entity
     
+    def bulk_add(self, entities: Iterable[T]) -> None:
+        """
+        Add many entities to the store in a single update.
+        
+        Args:
+            entities: The entities to add
+        """
+        get_id = self._get_id
+        self._store.update({get_id(entity): entity for entity in entities})
+        self._version += 1
+    
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """
         Retrieve an entity by its ID.
@@ -58,6 +82,18 @@ class BaseRepository(ABC, Generic[T]):
         """
         return list(self._store.values())
     
+    def iter_all(self) -> ValuesView[T]:
+        """
+        Iterate over all entities without copying them into a list.
+        
+        The view is live and read-only; do not mutate the repository
+        while iterating it.
+        
+        Returns:
+            View over all stored entities
+        """
+        return self._store.values()
+    
     def update(self, entity: T) -> Optional[T]:
         """
         Update an existing entity.
@@ -71,6 +107,7 @@ class BaseRepository(ABC, Generic[T]):
         entity_id = self._get_id(entity)
         if entity_id in self._store:
             self._store[entity_id] = entity
+            self._version += 1
             return entity
         return None
     
@@ -86,6 +123,7 @@ class BaseRepository(ABC, Generic[T]):
         """
         if entity_id in self._store:
             del self._store[entity_id]
+            self._version += 1
             return True
         return False
     
@@ -100,3 +138,4 @@ class BaseRepository(ABC, Generic[T]):
     def clear(self) -> None:
         """Clear all entities from the store."""
         self._store.clear()
+        self._version += 1
@@ -1,6 +1,7 @@
 """
 Customer repository for managing customer data.
 """
+from typing import Dict, Iterable, Optional
 from src.repositories.base import BaseRepository
 from src.entities.customer import Customer
 
@@ -10,12 +11,70 @@ class CustomerRepository(BaseRepository[Customer]):
     Repository for Customer entities.
     
     Provides CRUD operations for customers with in-memory storage.
+    A secondary index maps each phone number to the first stored customer
+    with that number, so find_by_phone is a single dict lookup.
     """
     
+    def __init__(self):
+        """Initialize the repository with an empty phone index."""
+        super().__init__()
+        self._by_phone: Dict[str, Customer] = {}
+    
     def _get_id(self, entity: Customer) -> int:
         """Extract customer_id from Customer entity."""
         return entity.customer_id
     
+    def _reindex_phone(self, phone: str) -> None:
+        """Point the phone index at the first stored customer with this phone."""
+        self._by_phone.pop(phone, None)
+        for customer in self._store.values():
+            if customer.phone == phone:
+                self._by_phone[phone] = customer
+                break
+    
+    def add(self, entity: Customer) -> Customer:
+        """Add a customer and index its phone number."""
+        previous = self._store.get(entity.customer_id)
+        super().add(entity)
+        if previous is None:
+            # New customers go to the end of the store, so an existing
+            # index entry for the same phone still wins
+            self._by_phone.setdefault(entity.phone, entity)
+        else:
+            self._reindex_phone(previous.phone)
+            self._reindex_phone(entity.phone)
+        return entity
+    
+    def bulk_add(self, entities: Iterable[Customer]) -> None:
+        """Add many customers and rebuild the phone index."""
+        super().bulk_add(entities)
+        self._by_phone = {}
+        for customer in self._store.values():
+            self._by_phone.setdefault(customer.phone, customer)
+    
+    def update(self, entity: Customer) -> Optional[Customer]:
+        """Update a customer and re-index the old and new phone numbers."""
+        previous = self._store.get(entity.customer_id)
+        if super().update(entity) is None:
+            return None
+        self._reindex_phone(previous.phone)
+        self._reindex_phone(entity.phone)
+        return entity
+    
+    def delete(self, entity_id: int) -> bool:
+        """Delete a customer and drop it from the phone index."""
+        customer = self._store.get(entity_id)
+        if not super().delete(entity_id):
+            return False
+        if self._by_phone.get(customer.phone) is customer:
+            self._reindex_phone(customer.phone)
+        return True
+    
+    def clear(self) -> None:
+        """Clear all customers and the phone index."""
+        super().clear()
+        self._by_phone.clear()
+    
     def find_by_phone(self, phone: str) -> Customer | None:
         """
         Find a customer by phone number.
@@ -26,7 +85,4 @@ class CustomerRepository(BaseRepository[Customer]):
         Returns:
             The customer if found, None otherwise
         """
-        for customer in self._store.values():
-            if customer.phone == phone:
-                return customer
-        return None
+        return self._by_phone.get(phone)
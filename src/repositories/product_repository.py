@@ -1,6 +1,9 @@
 """
 Product repository for managing product data.
 """
+from math import inf
+from typing import Dict, Iterable, Optional, Tuple
+from sortedcontainers import SortedList
 from src.repositories.base import BaseRepository
 from src.entities.product import Product
 
@@ -10,12 +13,90 @@ class ProductRepository(BaseRepository[Product]):
     Repository for Product entities.
     
     Provides CRUD operations for products with in-memory storage.
+    Products are also kept in lists sorted by price and by weight, so
+    range queries cost O(log n + k) instead of a full scan.
+    
+    The sorted lists hold (value, product_id) snapshots taken when the
+    product was indexed. Products are mutable, so a product edited in
+    place and then passed to update() or delete() is still removed under
+    the keys it was indexed with.
     """
     
+    def __init__(self):
+        """Initialize the repository with empty price and weight indexes."""
+        super().__init__()
+        self._by_price = SortedList()
+        self._by_weight = SortedList()
+        # (price, weight_kg) each product was indexed under
+        self._indexed_keys: Dict[int, Tuple[float, float]] = {}
+    
     def _get_id(self, entity: Product) -> int:
         """Extract product_id from Product entity."""
         return entity.product_id
     
+    def _index(self, product: Product) -> None:
+        """Insert a product into the sorted indexes."""
+        product_id = product.product_id
+        self._indexed_keys[product_id] = (product.price, product.weight_kg)
+        self._by_price.add((product.price, product_id))
+        self._by_weight.add((product.weight_kg, product_id))
+    
+    def _unindex(self, product_id: int) -> None:
+        """Remove a product from the sorted indexes by its indexed keys."""
+        price, weight_kg = self._indexed_keys.pop(product_id)
+        self._by_price.remove((price, product_id))
+        self._by_weight.remove((weight_kg, product_id))
+    
+    def _rebuild_indexes(self) -> None:
+        """Re-index every stored product."""
+        self._indexed_keys = {
+            product_id: (product.price, product.weight_kg)
+            for product_id, product in self._store.items()
+        }
+        self._by_price = SortedList(
+            (price, product_id)
+            for product_id, (price, _) in self._indexed_keys.items()
+        )
+        self._by_weight = SortedList(
+            (weight_kg, product_id)
+            for product_id, (_, weight_kg) in self._indexed_keys.items()
+        )
+    
+    def add(self, entity: Product) -> Product:
+        """Add a product and index it by price and weight."""
+        if entity.product_id in self._indexed_keys:
+            self._unindex(entity.product_id)
+        super().add(entity)
+        self._index(entity)
+        return entity
+    
+    def bulk_add(self, entities: Iterable[Product]) -> None:
+        """Add many products and rebuild the sorted indexes."""
+        super().bulk_add(entities)
+        self._rebuild_indexes()
+    
+    def update(self, entity: Product) -> Optional[Product]:
+        """Update a product and re-index it."""
+        if super().update(entity) is None:
+            return None
+        self._unindex(entity.product_id)
+        self._index(entity)
+        return entity
+    
+    def delete(self, entity_id: int) -> bool:
+        """Delete a product and drop it from the sorted indexes."""
+        if not super().delete(entity_id):
+            return False
+        self._unindex(entity_id)
+        return True
+    
+    def clear(self) -> None:
+        """Clear all products and the sorted indexes."""
+        super().clear()
+        self._by_price.clear()
+        self._by_weight.clear()
+        self._indexed_keys.clear()
+    
     def find_by_price_range(self, min_price: float, max_price: float) -> list[Product]:
         """
         Find products within a price range.
@@ -25,11 +106,13 @@ class ProductRepository(BaseRepository[Product]):
             max_price: Maximum price (inclusive)
             
         Returns:
-            List of products within the price range
+            List of products within the price range, ordered by price
         """
         return [
-            product for product in self._store.values()
-            if min_price <= product.price <= max_price
+            self._store[product_id]
+            for _, product_id in self._by_price.irange(
+                (min_price, -inf), (max_price, inf)
+            )
         ]
     
     def find_by_max_weight(self, max_weight_kg: float) -> list[Product]:
@@ -40,9 +123,9 @@ class ProductRepository(BaseRepository[Product]):
             max_weight_kg: Maximum weight in kg
             
         Returns:
-            List of products under the weight limit
+            List of products under the weight limit, ordered by weight
         """
         return [
-            product for product in self._store.values()
-            if product.weight_kg <= max_weight_kg
+            self._store[product_id]
+            for _, product_id in self._by_weight.irange(None, (max_weight_kg, inf))
         ]
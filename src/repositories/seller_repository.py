@@ -1,21 +1,101 @@
 """
 Seller repository for managing seller data.
 """
+from itertools import count
+from typing import Dict, Iterable, Optional, Set
 from src.repositories.base import BaseRepository
 from src.entities.seller import Seller
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class SellerRepository(BaseRepository[Seller]):
     """
     Repository for Seller entities.
     
     Provides CRUD operations for sellers (Kirana stores) with in-memory storage.
+    Lowercased names are cached at insertion time, and a trigram inverted
+    index narrows name searches to a small candidate set before the final
+    substring check.
     """
     
+    def __init__(self):
+        """Initialize the repository with empty name indexes."""
+        super().__init__()
+        self._name_lower: Dict[int, str] = {}
+        self._trigram_index: Dict[str, Set[int]] = {}
+        # Insertion rank per seller, to return matches in store order
+        self._rank: Dict[int, int] = {}
+        self._ranks = count()
+    
     def _get_id(self, entity: Seller) -> int:
         """Extract seller_id from Seller entity."""
         return entity.seller_id
     
+    def _index(self, seller: Seller) -> None:
+        """Add a seller's name to the name indexes."""
+        seller_id = seller.seller_id
+        name_lower = seller.name.lower()
+        self._name_lower[seller_id] = name_lower
+        if seller_id not in self._rank:
+            self._rank[seller_id] = next(self._ranks)
+        for trigram in _trigrams(name_lower):
+            self._trigram_index.setdefault(trigram, set()).add(seller_id)
+    
+    def _unindex(self, seller_id: int) -> None:
+        """Remove a seller's name from the trigram index."""
+        for trigram in _trigrams(self._name_lower[seller_id]):
+            ids = self._trigram_index[trigram]
+            ids.discard(seller_id)
+            if not ids:
+                del self._trigram_index[trigram]
+    
+    def add(self, entity: Seller) -> Seller:
+        """Add a seller and index its name."""
+        if entity.seller_id in self._store:
+            self._unindex(entity.seller_id)
+        super().add(entity)
+        self._index(entity)
+        return entity
+    
+    def bulk_add(self, entities: Iterable[Seller]) -> None:
+        """Add many sellers and rebuild the name indexes."""
+        super().bulk_add(entities)
+        self._name_lower = {}
+        self._trigram_index = {}
+        self._rank = {}
+        self._ranks = count()
+        for seller in self._store.values():
+            self._index(seller)
+    
+    def update(self, entity: Seller) -> Optional[Seller]:
+        """Update a seller and re-index its name."""
+        if entity.seller_id not in self._store:
+            return None
+        self._unindex(entity.seller_id)
+        super().update(entity)
+        self._index(entity)
+        return entity
+    
+    def delete(self, entity_id: int) -> bool:
+        """Delete a seller and drop it from the name indexes."""
+        if entity_id not in self._store:
+            return False
+        self._unindex(entity_id)
+        del self._name_lower[entity_id]
+        del self._rank[entity_id]
+        return super().delete(entity_id)
+    
+    def clear(self) -> None:
+        """Clear all sellers and the name indexes."""
+        super().clear()
+        self._name_lower.clear()
+        self._trigram_index.clear()
+        self._rank.clear()
+    
     def find_by_name(self, name: str) -> list[Seller]:
         """
         Find sellers by name (partial match, case-insensitive).
@@ -27,7 +107,31 @@ class SellerRepository(BaseRepository[Seller]):
             List of matching sellers
         """
         name_lower = name.lower()
-        return [
-            seller for seller in self._store.values()
-            if name_lower in seller.name.lower()
+        
+        # Too short for trigrams: scan the cached lowercase names
+        if len(name_lower) < 3:
+            return [
+                self._store[seller_id]
+                for seller_id, seller_name in self._name_lower.items()
+                if name_lower in seller_name
+            ]
+        
+        # Every trigram of the query must occur in a matching name
+        candidates: Optional[Set[int]] = None
+        for trigram in sorted(
+            _trigrams(name_lower),
+            key=lambda t: len(self._trigram_index.get(t, ()))
+        ):
+            ids = self._trigram_index.get(trigram)
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        
+        matches = [
+            seller_id for seller_id in candidates
+            if name_lower in self._name_lower[seller_id]
         ]
+        matches.sort(key=self._rank.__getitem__)
+        return [self._store[seller_id] for seller_id in matches]
@@ -1,17 +1,98 @@
 """
 Warehouse repository for managing warehouse data.
 """
+from dataclasses import dataclass
+import math
+from typing import Iterable, List, Optional
+import numpy as np
+from scipy.spatial import cKDTree
 from src.repositories.base import BaseRepository
 from src.entities.warehouse import Warehouse
 
 
+@dataclass
+class WarehouseCoordinates:
+    """
+    Nearest-neighbour search data for all warehouses.
+    
+    The k-d tree indexes each warehouse as a point on the unit sphere;
+    point i is warehouses[i]. Chord length grows monotonically with
+    great-circle distance, so its Euclidean nearest neighbour is also the
+    nearest warehouse.
+    
+    Attributes:
+        warehouses: Warehouses in tree order
+        tree: k-d tree over the (x, y, z) unit vectors
+    """
+    warehouses: List[Warehouse]
+    tree: cKDTree
+
+
 class WarehouseRepository(BaseRepository[Warehouse]):
     """
     Repository for Warehouse entities.
     
     Provides CRUD operations for warehouses with in-memory storage.
+    Also keeps a lazily built k-d tree over the warehouse coordinates for
+    nearest-neighbour search; it is discarded whenever the store changes.
     """
     
+    def __init__(self):
+        """Initialize the repository with no cached search tree."""
+        super().__init__()
+        self._coordinates: Optional[WarehouseCoordinates] = None
+    
     def _get_id(self, entity: Warehouse) -> int:
         """Extract warehouse_id from Warehouse entity."""
         return entity.warehouse_id
+    
+    def add(self, entity: Warehouse) -> Warehouse:
+        """Add a warehouse and invalidate the search tree."""
+        self._coordinates = None
+        return super().add(entity)
+    
+    def bulk_add(self, entities: Iterable[Warehouse]) -> None:
+        """Add many warehouses and invalidate the search tree."""
+        self._coordinates = None
+        super().bulk_add(entities)
+    
+    def update(self, entity: Warehouse) -> Optional[Warehouse]:
+        """Update a warehouse and invalidate the search tree."""
+        self._coordinates = None
+        return super().update(entity)
+    
+    def delete(self, entity_id: int) -> bool:
+        """Delete a warehouse and invalidate the search tree."""
+        self._coordinates = None
+        return super().delete(entity_id)
+    
+    def clear(self) -> None:
+        """Clear all warehouses and invalidate the search tree."""
+        self._coordinates = None
+        super().clear()
+    
+    def get_coordinates(self) -> WarehouseCoordinates:
+        """
+        Get the nearest-neighbour search data for all warehouses.
+        
+        The k-d tree is built on first use and reused until the next
+        mutation of the repository.
+        
+        Returns:
+            WarehouseCoordinates for every stored warehouse
+        """
+        if self._coordinates is None:
+            warehouses = list(self._store.values())
+            unit_vectors = np.array([
+                (
+                    loc.cos_lat * math.cos(loc.lng_rad),
+                    loc.cos_lat * math.sin(loc.lng_rad),
+                    math.sin(loc.lat_rad)
+                )
+                for loc in (w.location for w in warehouses)
+            ], dtype=np.float64).reshape(-1, 3)
+            self._coordinates = WarehouseCoordinates(
+                warehouses=warehouses,
+                tree=cKDTree(unit_vectors)
+            )
+        return self._coordinates
@@ -0,0 +1,211 @@
+"""
+Batch shipping charge calculation for bulk quote workloads.
+"""
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Optional, Sequence
+import numba
+from numba import njit, prange
+import numpy as np
+from src.entities.location import Location
+from src.entities.warehouse import Warehouse
+from src.repositories.customer_repository import CustomerRepository
+from src.repositories.product_repository import ProductRepository
+from src.services.distance_calculator import haversine_core
+from src.services.shipping_charge_service import (
+    DeliveryCost,
+    DeliverySpeed,
+    ShippingChargeService,
+    parse_delivery_speed
+)
+from src.services.warehouse_service import WarehouseService
+from src.strategies.factory import ShippingStrategyFactory
+from src.core.exceptions import NotFoundError, ValidationError
+
+
+_lat_rad = attrgetter("lat_rad")
+_lng_rad = attrgetter("lng_rad")
+_cos_lat = attrgetter("cos_lat")
+
+# The kernel is first launched from a server worker thread. TBB's pool,
+# once started off the main thread, keeps the process from exiting, so
+# prefer OpenMP whenever it is available.
+numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+
+@njit("f8[:](f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])", parallel=True, cache=True)
+def _batch_distances(lat1_rad, lng1_rad, cos_lat1, lat2_rad, lng2_rad, cos_lat2):
+    """
+    Haversine distance in kilometers for every row, across all cores.
+    
+    Each row goes through the same JIT kernel as DistanceCalculator, so
+    the results are identical to the scalar path.
+    """
+    n = lat1_rad.shape[0]
+    distance_km = np.empty(n)
+    for i in prange(n):
+        distance_km[i] = haversine_core(
+            lat1_rad[i], lng1_rad[i], cos_lat1[i],
+            lat2_rad[i], lng2_rad[i], cos_lat2[i]
+        )
+    return distance_km
+
+
+@dataclass
+class BatchShippingResult:
+    """
+    Structure-of-arrays result of a batch calculation.
+    
+    Row i of every field belongs to input row i. As in the single-row
+    service, only shipping_charges are rounded.
+    """
+    nearest_warehouses: List[Warehouse]
+    distances_km: List[float]
+    transport_modes: List[str]
+    transport_costs: List[float]
+    weights_kg: List[float]
+    delivery_costs: List[DeliveryCost]
+    shipping_charges: List[float]
+
+
+class BatchShippingService:
+    """
+    Service for pricing many (seller, customer, product) rows at once.
+    
+    Entity lookups happen in one Python pass, the Haversine distances for
+    all rows run in a parallel Numba kernel, and transport costs are
+    vectorized with NumPy over the factory's rate table. The arithmetic is
+    the same as in ShippingChargeService, so each row matches
+    calculate_total exactly. Delivery charges come from the injected ShippingChargeService, so a
+    subclass with different charges prices batches the same way.
+    """
+    
+    def __init__(
+        self,
+        customer_repo: CustomerRepository,
+        product_repo: ProductRepository,
+        warehouse_service: WarehouseService,
+        shipping_charge_service: ShippingChargeService,
+        strategy_factory: Optional[ShippingStrategyFactory] = None
+    ):
+        """
+        Initialize the batch shipping service.
+        
+        Args:
+            customer_repo: Repository for customer data
+            product_repo: Repository for product data
+            warehouse_service: Service for nearest-warehouse lookups
+            shipping_charge_service: Single-row service for delivery charges
+            strategy_factory: Factory for shipping rates (optional)
+        """
+        self._customer_repo = customer_repo
+        self._product_repo = product_repo
+        self._warehouse_service = warehouse_service
+        self._shipping_charge_service = shipping_charge_service
+        self._strategy_factory = strategy_factory or ShippingStrategyFactory()
+    
+    def calculate_total_batch(
+        self,
+        seller_ids: Sequence[int],
+        customer_ids: Sequence[int],
+        product_ids: Sequence[int],
+        delivery_speeds: Sequence[str]
+    ) -> BatchShippingResult:
+        """
+        Calculate total shipping charges for many rows.
+        
+        Each row ships product_ids[i] from the warehouse nearest to
+        seller_ids[i] to customer_ids[i] at delivery_speeds[i].
+        
+        Args:
+            seller_ids: Seller ID per row
+            customer_ids: Customer ID per row
+            product_ids: Product ID per row
+            delivery_speeds: 'standard' or 'express' per row
+            
+        Returns:
+            BatchShippingResult with one entry per row
+            
+        Raises:
+            NotFoundError: If any entity not found
+            ValidationError: If the inputs differ in length or a delivery
+                speed is invalid
+        """
+        n = len(seller_ids)
+        if not (len(customer_ids) == len(product_ids) == len(delivery_speeds) == n):
+            raise ValidationError(
+                "sellerIds, customerIds, productIds and deliverySpeeds "
+                "must have the same length"
+            )
+        
+        # Gather entities in one pass; bound methods are hoisted into
+        # locals since this loop runs once per row
+        get_product = self._product_repo.get_by_id
+        get_customer = self._customer_repo.get_by_id
+        find_nearest = self._warehouse_service.find_nearest_warehouse
+        warehouses: List[Warehouse] = []
+        weights: List[float] = []
+        speeds: List[DeliverySpeed] = []
+        origins: List[Location] = []
+        destinations: List[Location] = []
+        add_warehouse = warehouses.append
+        add_weight = weights.append
+        add_speed = speeds.append
+        add_origin = origins.append
+        add_destination = destinations.append
+        for seller_id, customer_id, product_id, delivery_speed in zip(
+            seller_ids, customer_ids, product_ids, delivery_speeds
+        ):
+            product = get_product(product_id)
+            if not product:
+                raise NotFoundError(f"Product with ID {product_id} not found")
+            
+            warehouse, _ = find_nearest(seller_id)
+            
+            speed = parse_delivery_speed(delivery_speed)
+            
+            customer = get_customer(customer_id)
+            if not customer:
+                raise NotFoundError(f"Customer with ID {customer_id} not found")
+            
+            add_warehouse(warehouse)
+            add_weight(product.weight_kg)
+            add_speed(speed)
+            add_origin(warehouse.location)
+            add_destination(customer.location)
+        
+        distances_km = _batch_distances(
+            np.fromiter(map(_lat_rad, origins), np.float64, n),
+            np.fromiter(map(_lng_rad, origins), np.float64, n),
+            np.fromiter(map(_cos_lat, origins), np.float64, n),
+            np.fromiter(map(_lat_rad, destinations), np.float64, n),
+            np.fromiter(map(_lng_rad, destinations), np.float64, n),
+            np.fromiter(map(_cos_lat, destinations), np.float64, n)
+        )
+        
+        # Same selection as get_rate: bisect_right over the breakpoints
+        breakpoints, rate_table = self._strategy_factory.get_rate_table()
+        rate_index = np.searchsorted(breakpoints, distances_km, side="right")
+        rates = np.array([rate for _, rate in rate_table], dtype=np.float64)
+        
+        # Same operation order as ShippingChargeService, so results match
+        transport_costs = (
+            distances_km * rates[rate_index] * np.array(weights, dtype=np.float64)
+        ).tolist()
+        delivery_costs = list(map(
+            self._shipping_charge_service._calculate_delivery_cost, speeds, weights
+        ))
+        
+        return BatchShippingResult(
+            nearest_warehouses=warehouses,
+            distances_km=distances_km.tolist(),
+            transport_modes=[rate_table[index][0] for index in rate_index.tolist()],
+            transport_costs=transport_costs,
+            weights_kg=weights,
+            delivery_costs=delivery_costs,
+            # Python's round, like the single-row path (np.round differs)
+            shipping_charges=[
+                round(transport_cost + delivery_cost.total, 2)
+                for transport_cost, delivery_cost in zip(transport_costs, delivery_costs)
+            ]
+        )
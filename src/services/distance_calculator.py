@@ -2,9 +2,105 @@
 Distance calculator using Haversine formula.
 """
 import math
+from numba import njit
+import numpy as np
 from src.entities.location import Location
 
 
+# Earth's radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+# Explicit signature: compiled eagerly at import (and cached on disk),
+# not on the first request
+@njit("f8(f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def haversine_core(
+    lat1_rad: float,
+    lng1_rad: float,
+    cos_lat1: float,
+    lat2_rad: float,
+    lng2_rad: float,
+    cos_lat2: float
+) -> float:
+    """
+    Haversine distance in kilometers between two points given in radians.
+    
+    Args:
+        lat1_rad: Latitude of first point in radians
+        lng1_rad: Longitude of first point in radians
+        cos_lat1: Cosine of the first latitude
+        lat2_rad: Latitude of second point in radians
+        lng2_rad: Longitude of second point in radians
+        cos_lat2: Cosine of the second latitude
+        
+    Returns:
+        Unrounded distance in kilometers
+    """
+    # Differences
+    dlat = lat2_rad - lat1_rad
+    dlon = lng2_rad - lng1_rad
+    
+    # Haversine formula
+    a = (
+        math.sin(dlat / 2) ** 2 +
+        cos_lat1 * cos_lat2 * math.sin(dlon / 2) ** 2
+    )
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    
+    return EARTH_RADIUS_KM * c
+
+
+@njit("f8(f8, f8, f8, f8)", cache=True, fastmath=True)
+def haversine_degrees(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Haversine distance in kilometers between two points given in degrees.
+    
+    Args:
+        lat1: Latitude of first point
+        lng1: Longitude of first point
+        lat2: Latitude of second point
+        lng2: Longitude of second point
+        
+    Returns:
+        Unrounded distance in kilometers
+    """
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    return haversine_core(
+        lat1_rad, math.radians(lng1), math.cos(lat1_rad),
+        lat2_rad, math.radians(lng2), math.cos(lat2_rad)
+    )
+
+
+@njit("f8[:](f8, f8, f8[:], f8[:])", cache=True, fastmath=True)
+def haversine_bulk_degrees(
+    lat1: float,
+    lng1: float,
+    lats2: np.ndarray,
+    lngs2: np.ndarray
+) -> np.ndarray:
+    """
+    Haversine distances in kilometers from one point to many, in degrees.
+    
+    One fused pass over the inputs: every target goes through the scalar
+    kernel, so no intermediate array is allocated per operation.
+    
+    Args:
+        lat1: Latitude of the origin
+        lng1: Longitude of the origin
+        lats2: Latitudes of the targets
+        lngs2: Longitudes of the targets
+        
+    Returns:
+        Array of unrounded distances in kilometers, one per target
+    """
+    n = lats2.shape[0]
+    distances = np.empty(n)
+    for i in range(n):
+        distances[i] = haversine_degrees(lat1, lng1, lats2[i], lngs2[i])
+    return distances
+
+
 class DistanceCalculator:
     """
     Calculates distances between geographic coordinates using the Haversine formula.
@@ -20,41 +116,28 @@ class DistanceCalculator:
     Where R is the Earth's radius (approximately 6371 km).
     """
     
-    # Earth's radius in kilometers
-    EARTH_RADIUS_KM = 6371.0
+    # Earth's radius in kilometers (shared with the JIT kernel)
+    EARTH_RADIUS_KM = EARTH_RADIUS_KM
     
     @classmethod
     def calculate(cls, location1: Location, location2: Location) -> float:
         """
         Calculate the distance between two locations in kilometers.
         
+        Uses the radian values each Location precomputes on construction,
+        so no degree conversion or cos(lat) happens per call.
+        
         Args:
             location1: The first location
             location2: The second location
             
         Returns:
-            Distance in kilometers, rounded to 2 decimal places
+            Unrounded distance in kilometers; round for display only
         """
-        # Convert degrees to radians
-        lat1 = math.radians(location1.lat)
-        lat2 = math.radians(location2.lat)
-        lon1 = math.radians(location1.lng)
-        lon2 = math.radians(location2.lng)
-        
-        # Differences
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        # Haversine formula
-        a = (
-            math.sin(dlat / 2) ** 2 +
-            math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        return haversine_core(
+            location1.lat_rad, location1.lng_rad, location1.cos_lat,
+            location2.lat_rad, location2.lng_rad, location2.cos_lat
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        distance = cls.EARTH_RADIUS_KM * c
-        
-        return round(distance, 2)
     
     @classmethod
     def calculate_from_coords(
@@ -67,7 +150,9 @@ class DistanceCalculator:
         """
         Calculate distance from raw coordinates.
         
-        Convenience method that accepts raw float coordinates.
+        Convenience method that accepts raw float coordinates. Goes straight
+        to the JIT kernel without building Location objects, so the
+        coordinates are not range-checked.
         
         Args:
             lat1: Latitude of first point
@@ -78,6 +163,34 @@ class DistanceCalculator:
         Returns:
             Distance in kilometers
         """
-        location1 = Location(lat=lat1, lng=lng1)
-        location2 = Location(lat=lat2, lng=lng2)
-        return cls.calculate(location1, location2)
+        return haversine_degrees(lat1, lng1, lat2, lng2)
+    
+    @classmethod
+    def calculate_bulk(
+        cls,
+        lat1: float,
+        lng1: float,
+        lats2: np.ndarray,
+        lngs2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate distances from one point to many points in a single pass.
+        
+        Vectorized counterpart of calculate_from_coords, run as a single
+        fused JIT loop.
+        
+        Args:
+            lat1: Latitude of the origin in degrees
+            lng1: Longitude of the origin in degrees
+            lats2: Latitudes of the targets in degrees
+            lngs2: Longitudes of the targets in degrees
+            
+        Returns:
+            Array of distances in kilometers, one per target
+        """
+        return haversine_bulk_degrees(
+            lat1,
+            lng1,
+            np.asarray(lats2, dtype=np.float64),
+            np.asarray(lngs2, dtype=np.float64)
+        )
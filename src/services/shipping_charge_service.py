@@ -3,7 +3,8 @@ Shipping charge service for calculating shipping costs.
 """
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from src.entities.warehouse import Warehouse
 from src.entities.customer import Customer
 from src.entities.product import Product
@@ -13,25 +14,86 @@ from src.repositories.product_repository import ProductRepository
 from src.services.distance_calculator import DistanceCalculator
 from src.services.warehouse_service import WarehouseService
 from src.strategies.factory import ShippingStrategyFactory
-from src.strategies.base import ShippingCostResult
 from src.core.exceptions import NotFoundError, ValidationError
 
 
-class DeliverySpeed(str, Enum):
+class DeliverySpeed(Enum):
     """Supported delivery speed options."""
     STANDARD = "standard"
     EXPRESS = "express"
 
 
-@dataclass
+# Plain dict probe instead of Enum.__call__ on every request
+_SPEED_MAP = {s.value: s for s in DeliverySpeed}
+
+
+def parse_delivery_speed(speed: str) -> DeliverySpeed:
+    """
+    Validate and parse a delivery speed string.
+    
+    Args:
+        speed: The delivery speed string (case-insensitive)
+        
+    Returns:
+        DeliverySpeed enum value
+        
+    Raises:
+        ValidationError: If speed is not supported
+    """
+    parsed = _SPEED_MAP.get(speed.lower())
+    if parsed is None:
+        valid_speeds = [s.value for s in DeliverySpeed]
+        raise ValidationError(
+            f"Invalid delivery speed '{speed}'. "
+            f"Supported speeds: {valid_speeds}"
+        )
+    return parsed
+
+
+@dataclass(frozen=True)
 class DeliveryCost:
-    """Delivery speed cost breakdown."""
+    """Delivery speed cost breakdown. Frozen: instances are shared by the cache."""
     base_charge: float
     extra_charge: float
     total: float
     speed: str
 
 
+@lru_cache(maxsize=1024)
+def _delivery_cost(
+    speed: DeliverySpeed,
+    weight_kg: float,
+    base_charge: float,
+    express_extra_per_kg: float
+) -> DeliveryCost:
+    """
+    Build the DeliveryCost for a speed and weight.
+    
+    Weights come from a finite product catalog, so the same pairs recur
+    across requests and are served from the cache.
+    
+    Args:
+        speed: The delivery speed
+        weight_kg: Product weight in kg
+        base_charge: Base courier charge in INR
+        express_extra_per_kg: Express surcharge in INR per kg
+        
+    Returns:
+        DeliveryCost with breakdown
+    """
+    extra_charge = 0.0
+    
+    if speed is DeliverySpeed.EXPRESS:
+        extra_charge = express_extra_per_kg * weight_kg
+    
+    return DeliveryCost(
+        base_charge=base_charge,
+        extra_charge=extra_charge,
+        total=base_charge + extra_charge,
+        speed=speed.value
+    )
+
+
 @dataclass
 class ShippingChargeResult:
     """Complete shipping charge result with detailed breakdown."""
@@ -63,12 +125,19 @@ class ShippingChargeService:
         transport_cost = distance × rate × weight
         delivery_cost = base_charge + (extra_per_kg × weight for express)
         total = transport_cost + delivery_cost
+    
+    calculate_total caches the warehouse-to-customer quote per (warehouse,
+    customer, product, speed). The cache is dropped whenever the warehouse,
+    customer or product repository or the strategy table changes.
     """
     
     # Delivery speed charges
     BASE_COURIER_CHARGE = 10.0  # INR
     EXPRESS_EXTRA_PER_KG = 1.2  # INR per kg
     
+    # Cached quotes kept before the cache is emptied and refilled
+    QUOTE_CACHE_SIZE = 4096
+    
     def __init__(
         self,
         warehouse_repo: WarehouseRepository,
@@ -92,6 +161,8 @@ class ShippingChargeService:
         self._product_repo = product_repo
         self._warehouse_service = warehouse_service
         self._strategy_factory = strategy_factory or ShippingStrategyFactory()
+        self._quote_cache: Dict[Tuple[int, int, int, str], ShippingChargeResult] = {}
+        self._cache_versions: Tuple[int, int, int, int] = (-1, -1, -1, -1)
     
     def _validate_delivery_speed(self, speed: str) -> DeliverySpeed:
         """
@@ -106,14 +177,7 @@ class ShippingChargeService:
         Raises:
             ValidationError: If speed is not supported
         """
-        try:
-            return DeliverySpeed(speed.lower())
-        except ValueError:
-            valid_speeds = [s.value for s in DeliverySpeed]
-            raise ValidationError(
-                f"Invalid delivery speed '{speed}'. "
-                f"Supported speeds: {valid_speeds}"
-            )
+        return parse_delivery_speed(speed)
     
     def _calculate_delivery_cost(
         self,
@@ -133,17 +197,11 @@ class ShippingChargeService:
         Returns:
             DeliveryCost with breakdown
         """
-        base_charge = self.BASE_COURIER_CHARGE
-        extra_charge = 0.0
-        
-        if speed == DeliverySpeed.EXPRESS:
-            extra_charge = self.EXPRESS_EXTRA_PER_KG * weight_kg
-        
-        return DeliveryCost(
-            base_charge=base_charge,
-            extra_charge=round(extra_charge, 2),
-            total=round(base_charge + extra_charge, 2),
-            speed=speed.value
+        return _delivery_cost(
+            speed,
+            weight_kg,
+            self.BASE_COURIER_CHARGE,
+            self.EXPRESS_EXTRA_PER_KG
         )
     
     def calculate_from_warehouse(
@@ -191,24 +249,22 @@ class ShippingChargeService:
             customer.location
         )
         
-        # Get transport strategy and calculate transport cost
-        strategy = self._strategy_factory.get_strategy(distance_km)
-        transport_result: ShippingCostResult = strategy.calculate_cost(
-            distance_km,
-            product.weight_kg
-        )
+        # Look up the transport mode/rate and price the leg inline
+        transport_mode, rate = self._strategy_factory.get_rate(distance_km)
+        transport_cost = distance_km * rate * product.weight_kg
         
         # Calculate delivery speed cost
         delivery_cost = self._calculate_delivery_cost(speed, product.weight_kg)
         
-        # Total shipping charge
-        total_charge = transport_result.transport_cost + delivery_cost.total
+        # Total shipping charge; the only value rounded here, everything
+        # else is rounded when the response is serialized
+        total_charge = transport_cost + delivery_cost.total
         
         return ShippingChargeResult(
             shipping_charge=round(total_charge, 2),
             distance_km=distance_km,
-            transport_mode=transport_result.transport_mode,
-            transport_cost=transport_result.transport_cost,
+            transport_mode=transport_mode,
+            transport_cost=transport_cost,
             delivery_cost=delivery_cost,
             weight_kg=product.weight_kg
         )
@@ -250,13 +306,34 @@ class ShippingChargeService:
         nearest_warehouse, seller_to_warehouse_distance = \
             self._warehouse_service.find_nearest_warehouse(seller_id)
         
-        # Calculate shipping from warehouse to customer
-        shipping_result = self.calculate_from_warehouse(
-            warehouse_id=nearest_warehouse.warehouse_id,
-            customer_id=customer_id,
-            product_id=product_id,
-            delivery_speed=delivery_speed
+        # Serve repeated quotes from the cache unless an input has changed
+        versions = (
+            self._warehouse_repo.version,
+            self._customer_repo.version,
+            self._product_repo.version,
+            self._strategy_factory.version
+        )
+        cache_full = len(self._quote_cache) >= self.QUOTE_CACHE_SIZE
+        if versions != self._cache_versions or cache_full:
+            self._quote_cache.clear()
+            self._cache_versions = versions
+        key = (
+            nearest_warehouse.warehouse_id,
+            customer_id,
+            product_id,
+            delivery_speed.lower()
         )
+        shipping_result = self._quote_cache.get(key)
+        
+        # Calculate shipping from warehouse to customer
+        if shipping_result is None:
+            shipping_result = self.calculate_from_warehouse(
+                warehouse_id=nearest_warehouse.warehouse_id,
+                customer_id=customer_id,
+                product_id=product_id,
+                delivery_speed=delivery_speed
+            )
+            self._quote_cache[key] = shipping_result
         
         return TotalShippingResult(
             shipping_charge=shipping_result.shipping_charge,
@@ -1,7 +1,8 @@
 """
 Warehouse service for finding nearest warehouse.
 """
-from typing import Optional, Tuple
+import math
+from typing import Dict, Tuple
 from src.entities.warehouse import Warehouse
 from src.entities.seller import Seller
 from src.repositories.warehouse_repository import WarehouseRepository
@@ -15,6 +16,8 @@ class WarehouseService:
     Service for warehouse-related business logic.
     
     Handles finding the nearest warehouse to a seller's location.
+    Nearest-warehouse results are cached per seller and dropped whenever
+    the warehouse or seller repository changes.
     """
     
     def __init__(
@@ -31,6 +34,8 @@ class WarehouseService:
         """
         self._warehouse_repo = warehouse_repo
         self._seller_repo = seller_repo
+        self._nearest_cache: Dict[int, Tuple[Warehouse, float]] = {}
+        self._cache_versions: Tuple[int, int] = (-1, -1)
     
     def find_nearest_warehouse(self, seller_id: int) -> Tuple[Warehouse, float]:
         """
@@ -45,30 +50,41 @@ class WarehouseService:
         Raises:
             NotFoundError: If seller not found or no warehouses exist
         """
+        # Serve from the per-seller cache unless a repository has changed
+        versions = (self._warehouse_repo.version, self._seller_repo.version)
+        if versions != self._cache_versions:
+            self._nearest_cache.clear()
+            self._cache_versions = versions
+        cached = self._nearest_cache.get(seller_id)
+        if cached is not None:
+            return cached
+        
         # Get the seller
         seller = self._seller_repo.get_by_id(seller_id)
         if not seller:
             raise NotFoundError(f"Seller with ID {seller_id} not found")
         
-        # Get all warehouses
-        warehouses = self._warehouse_repo.get_all()
-        if not warehouses:
+        # Get all warehouse coordinates and their k-d tree
+        coordinates = self._warehouse_repo.get_coordinates()
+        if not coordinates.warehouses:
             raise NotFoundError("No warehouses available in the system")
         
-        # Find the nearest warehouse
-        nearest: Optional[Warehouse] = None
-        min_distance = float('inf')
+        # Nearest neighbour on the unit sphere is the nearest warehouse by
+        # great-circle distance: an O(log N) k-d tree query
+        location = seller.location
+        _, index = coordinates.tree.query((
+            location.cos_lat * math.cos(location.lng_rad),
+            location.cos_lat * math.sin(location.lng_rad),
+            math.sin(location.lat_rad)
+        ))
+        nearest = coordinates.warehouses[int(index)]
         
-        for warehouse in warehouses:
-            distance = DistanceCalculator.calculate(
-                seller.location,
-                warehouse.location
-            )
-            if distance < min_distance:
-                min_distance = distance
-                nearest = warehouse
+        # Exact distance only for the winner
+        distance = DistanceCalculator.calculate(seller.location, nearest.location)
         
-        return nearest, min_distance
+        result = (nearest, distance)
+        self._nearest_cache[seller_id] = result
+        return result
     
     def get_warehouse(self, warehouse_id: int) -> Warehouse:
         """
@@ -2,9 +2,11 @@
 Aeroplane shipping strategy for long distances (500+ km).
 """
 import math
+from typing import final
 from src.strategies.base import ShippingStrategy
 
 
+@final
 class AeroplaneStrategy(ShippingStrategy):
     """
     Shipping strategy for Aeroplane transport.
@@ -13,6 +15,8 @@ class AeroplaneStrategy(ShippingStrategy):
     Rate: 1 INR per km per kg
     """
     
+    __slots__ = ()
+    
     @property
     def min_distance(self) -> float:
         return 500
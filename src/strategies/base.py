@@ -5,9 +5,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShippingCostResult:
-    """Result of shipping cost calculation."""
+    """Result of shipping cost calculation. Frozen and slotted: it is a value."""
     transport_cost: float
     distance_km: float
     weight_kg: float
@@ -26,8 +26,12 @@ class ShippingStrategy(ABC):
     - Distance range it applies to (min_distance, max_distance)
     - Rate per km per kg
     - Transport mode name
+    
+    Strategies hold no per-instance state, so they declare empty slots.
     """
     
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def min_distance(self) -> float:
@@ -80,7 +84,7 @@ class ShippingStrategy(ABC):
         transport_cost = distance_km * self.rate_per_km_per_kg * weight_kg
         
         return ShippingCostResult(
-            transport_cost=round(transport_cost, 2),
+            transport_cost=transport_cost,
             distance_km=distance_km,
             weight_kg=weight_kg,
             transport_mode=self.mode_name,
@@ -1,7 +1,8 @@
 """
 Factory for selecting the appropriate shipping strategy based on distance.
 """
-from typing import List
+from bisect import bisect_right
+from typing import List, Tuple
 from src.strategies.base import ShippingStrategy
 from src.strategies.mini_van import MiniVanStrategy
 from src.strategies.truck import TruckStrategy
@@ -14,6 +15,13 @@ class ShippingStrategyFactory:
     
     Uses the Factory pattern to encapsulate strategy selection logic
     based on distance. Strategies are registered in order of precedence.
+    
+    Applicability only changes at a strategy's min or max distance, so the
+    strategy for every interval between those breakpoints is resolved once,
+    and get_strategy is a single bisect into that table.
+    
+    Registering a strategy bumps a version counter, so callers can cache
+    prices derived from the table and detect when they have gone stale.
     """
     
     def __init__(self):
@@ -23,6 +31,41 @@ class ShippingStrategyFactory:
             TruckStrategy(),
             AeroplaneStrategy()
         ]
+        self._version = 0
+        self._build_lookup()
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a strategy is registered."""
+        return self._version
+    
+    def _resolve(self, distance_km: float) -> ShippingStrategy:
+        """Pick a strategy by scanning the registered strategies in order."""
+        for strategy in self._strategies:
+            if strategy.is_applicable(distance_km):
+                return strategy
+        
+        # Fallback to aeroplane for any distance not covered
+        # This handles edge cases like exactly 500km
+        return self._strategies[-1]
+    
+    def _build_lookup(self) -> None:
+        """Precompute the strategy for each interval between breakpoints."""
+        breakpoints = sorted({
+            bound
+            for strategy in self._strategies
+            for bound in (strategy.min_distance, strategy.max_distance)
+        })
+        self._breakpoints: List[float] = breakpoints
+        # Entry i covers [breakpoints[i - 1], breakpoints[i]); entry 0 is
+        # everything below the first breakpoint
+        self._lookup: List[ShippingStrategy] = [self._strategies[-1]] + [
+            self._resolve(bound) for bound in breakpoints
+        ]
+        self._rates: List[Tuple[str, float]] = [
+            (strategy.mode_name, strategy.rate_per_km_per_kg)
+            for strategy in self._lookup
+        ]
     
     def get_strategy(self, distance_km: float) -> ShippingStrategy:
         """
@@ -40,13 +83,40 @@ class ShippingStrategyFactory:
         if distance_km < 0:
             raise ValueError(f"Distance cannot be negative: {distance_km}")
         
-        for strategy in self._strategies:
-            if strategy.is_applicable(distance_km):
-                return strategy
+        return self._lookup[bisect_right(self._breakpoints, distance_km)]
+    
+    def get_rate(self, distance_km: float) -> Tuple[str, float]:
+        """
+        Get the transport mode and rate that apply to the given distance.
         
-        # Fallback to aeroplane for any distance not covered
-        # This handles edge cases like exactly 500km
-        return self._strategies[-1]
+        Same selection as get_strategy, but returns the strategy's
+        precomputed (mode_name, rate_per_km_per_kg) pair so callers can
+        price a shipment without going through calculate_cost.
+        
+        Args:
+            distance_km: The shipping distance in kilometers
+            
+        Returns:
+            Tuple of (transport mode name, rate in INR per km per kg)
+            
+        Raises:
+            ValueError: If distance is negative
+        """
+        if distance_km < 0:
+            raise ValueError(f"Distance cannot be negative: {distance_km}")
+        
+        return self._rates[bisect_right(self._breakpoints, distance_km)]
+    
+    def get_rate_table(self) -> Tuple[List[float], List[Tuple[str, float]]]:
+        """
+        Get the precomputed lookup table behind get_rate.
+        
+        The entry for a distance d is rates[bisect_right(breakpoints, d)].
+        
+        Returns:
+            Tuple of (sorted breakpoints, (mode_name, rate) per interval)
+        """
+        return list(self._breakpoints), list(self._rates)
     
     def get_all_strategies(self) -> List[ShippingStrategy]:
         """Return all registered strategies."""
@@ -64,3 +134,5 @@ class ShippingStrategyFactory:
         self._strategies.append(strategy)
         # Sort by min_distance to ensure proper evaluation order
         self._strategies.sort(key=lambda s: s.min_distance)
+        self._build_lookup()
+        self._version += 1
@@ -1,9 +1,11 @@
 """
 Mini Van shipping strategy for short distances (0-100 km).
 """
+from typing import final
 from src.strategies.base import ShippingStrategy
 
 
+@final
 class MiniVanStrategy(ShippingStrategy):
     """
     Shipping strategy for Mini Van transport.
@@ -12,6 +14,8 @@ class MiniVanStrategy(ShippingStrategy):
     Rate: 3 INR per km per kg
     """
     
+    __slots__ = ()
+    
     @property
     def min_distance(self) -> float:
         return 0
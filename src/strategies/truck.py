@@ -1,9 +1,11 @@
 """
 Truck shipping strategy for medium distances (100-500 km).
 """
+from typing import final
 from src.strategies.base import ShippingStrategy
 
 
+@final
 class TruckStrategy(ShippingStrategy):
     """
     Shipping strategy for Truck transport.
@@ -12,6 +14,8 @@ class TruckStrategy(ShippingStrategy):
     Rate: 2 INR per km per kg
     """
     
+    __slots__ = ()
+    
     @property
     def min_distance(self) -> float:
         return 100
@@ -2,40 +2,43 @@
 Pytest configuration and fixtures.
 """
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from src.main import app
 from src.core.dependencies import reset_dependencies, get_repositories, get_services
 
 
-@pytest.fixture(scope="function")
-def client():
+@pytest.fixture(scope="session")
+def repositories():
     """
-    Create a test client for each test.
+    Get repositories seeded once for the whole session.
     
-    Resets dependencies to ensure clean state.
+    No test writes to the seeded repositories; tests that mutate data
+    build their own repository instances.
     """
     reset_dependencies()
-    # Re-initialize dependencies with fresh data
-    _ = get_repositories()
-    _ = get_services()
-    
-    with TestClient(app) as test_client:
-        yield test_client
+    yield get_repositories()
     
     # Cleanup
     reset_dependencies()
 
 
-@pytest.fixture
-def repositories():
-    """Get initialized repositories."""
-    reset_dependencies()
-    return get_repositories()
+@pytest.fixture(scope="session")
+def services(repositories):
+    """Get services built once over the session repositories."""
+    return get_services()
 
 
-@pytest.fixture
-def services():
-    """Get initialized services."""
-    reset_dependencies()
-    _ = get_repositories()  # Ensure repos are initialized first
-    return get_services()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(services):
+    """
+    Create one async test client for the whole session.
+    
+    The API tests only read the seeded data, so the app shares the
+    session repositories and services. Requests go straight to the ASGI
+    app in the test's event loop, without the thread portal of
+    Starlette's TestClient.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
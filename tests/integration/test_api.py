@@ -1,192 +1,225 @@
 """
 Integration tests for API endpoints.
 """
+import orjson
 import pytest
+import pytest_asyncio
+
+
+# The shared AsyncClient lives on the session event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def json_body(response):
+    """Decode a response body with orjson, like the API encodes it."""
+    return orjson.loads(response.content)
+
+
+# Warehouse 1 (Mumbai), Customer 1 (Pune, ~120km), Product 1 (5kg rice)
+DEFAULT_SHIPPING_PARAMS = {
+    "warehouseId": 1,
+    "customerId": 1,
+    "productId": 1,
+    "deliverySpeed": "standard"
+}
+
+# (param overrides, expected status, check on the response body)
+SHIPPING_CHARGE_CASES = [
+    pytest.param(
+        {},
+        200,
+        lambda data: (
+            data["shippingCharge"] > 0
+            and data["breakdown"]["deliveryCost"]["speed"] == "standard"
+        ),
+        id="standard-delivery"
+    ),
+    pytest.param(
+        {"deliverySpeed": "express"},
+        200,
+        lambda data: (
+            data["breakdown"]["deliveryCost"]["speed"] == "express"
+            and data["breakdown"]["deliveryCost"]["extraCharge"] > 0
+        ),
+        id="express-delivery"
+    ),
+    pytest.param(
+        {"warehouseId": 9999},
+        404,
+        lambda data: "Warehouse" in data["message"],
+        id="warehouse-not-found"
+    ),
+    pytest.param(
+        {"warehouseId": 0},
+        400,
+        lambda data: "warehouseId" in data["message"],
+        id="invalid-warehouse-id"
+    ),
+    pytest.param(
+        {"customerId": 9999},
+        404,
+        lambda data: "Customer" in data["message"],
+        id="customer-not-found"
+    ),
+    pytest.param(
+        {"deliverySpeed": "superfast"},
+        400,
+        lambda data: "Invalid delivery speed" in data["message"],
+        id="invalid-delivery-speed"
+    ),
+    pytest.param(
+        {},
+        200,
+        lambda data: data["breakdown"]["transportMode"] == "Truck",
+        id="medium-distance-uses-truck"
+    ),
+    pytest.param(
+        # Customer 4 (Kochi) ~1350km
+        {"customerId": 4},
+        200,
+        lambda data: data["breakdown"]["transportMode"] == "Aeroplane",
+        id="long-distance-uses-aeroplane"
+    ),
+    pytest.param(
+        # 10kg wheat flour: express extra charge = 1.2 * 10 = 12
+        {"productId": 3, "deliverySpeed": "express"},
+        200,
+        lambda data: (
+            data["breakdown"]["weightKg"] == 10.0
+            and data["breakdown"]["deliveryCost"]["extraCharge"] == 12.0
+        ),
+        id="heavy-product"
+    ),
+    pytest.param(
+        # 0.5kg tea: express extra charge = 1.2 * 0.5 = 0.6
+        {"productId": 5, "deliverySpeed": "express"},
+        200,
+        lambda data: (
+            data["breakdown"]["weightKg"] == 0.5
+            and data["breakdown"]["deliveryCost"]["extraCharge"] == 0.6
+        ),
+        id="light-product"
+    ),
+]
 
 
 class TestHealthEndpoints:
     """Test health check endpoints."""
     
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, client):
         """Test root health check."""
-        response = client.get("/")
+        response = await client.get("/")
         
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["status"] == "healthy"
         assert data["service"] == "B2B Shipping Charge Estimator"
     
-    def test_health_endpoint(self, client):
+    async def test_health_endpoint(self, client):
         """Test /health endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
         
         assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
+        assert json_body(response)["status"] == "healthy"
 
 
 class TestNearestWarehouseAPI:
     """Test GET /api/v1/warehouse/nearest endpoint."""
     
-    def test_success(self, client):
+    async def test_success(self, client):
         """Test successful nearest warehouse lookup."""
-        response = client.get(
+        response = await client.get(
             "/api/v1/warehouse/nearest",
             params={"sellerId": 1, "productId": 1}
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert "warehouseId" in data
         assert "warehouseLocation" in data
         assert "lat" in data["warehouseLocation"]
         assert "lng" in data["warehouseLocation"]
     
-    def test_seller_not_found(self, client):
+    async def test_seller_not_found(self, client):
         """Test error when seller doesn't exist."""
-        response = client.get(
+        response = await client.get(
             "/api/v1/warehouse/nearest",
             params={"sellerId": 9999, "productId": 1}
         )
         
         assert response.status_code == 404
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "NotFoundError"
         assert "Seller" in data["message"]
     
-    def test_missing_seller_id(self, client):
+    async def test_missing_seller_id(self, client):
         """Test validation error for missing sellerId."""
-        response = client.get(
+        response = await client.get(
             "/api/v1/warehouse/nearest",
             params={"productId": 1}  # Missing sellerId
         )
         
         assert response.status_code == 422  # Validation error
     
-    def test_invalid_seller_id(self, client):
+    async def test_invalid_seller_id(self, client):
         """Test validation error for invalid sellerId."""
-        response = client.get(
+        response = await client.get(
             "/api/v1/warehouse/nearest",
             params={"sellerId": -1, "productId": 1}
         )
         
-        assert response.status_code == 422
+        assert response.status_code == 400
+        data = json_body(response)
+        assert data["error"] == "ValidationError"
+        assert "sellerId" in data["message"]
 
 
 class TestShippingChargeAPI:
     """Test GET /api/v1/shipping-charge endpoint."""
     
-    def test_standard_delivery(self, client):
-        """Test shipping charge with standard delivery."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "shippingCharge" in data
-        assert data["shippingCharge"] > 0
-        assert "breakdown" in data
-        assert data["breakdown"]["deliveryCost"]["speed"] == "standard"
+    @pytest_asyncio.fixture(scope="class", loop_scope="session", autouse=True)
+    @classmethod
+    async def warmup(cls, client):
+        """Hit the endpoint once so first-request setup is not timed in a case."""
+        await client.get("/api/v1/shipping-charge", params=DEFAULT_SHIPPING_PARAMS)
     
-    def test_express_delivery(self, client):
-        """Test shipping charge with express delivery."""
-        response = client.get(
+    @pytest.mark.parametrize("params, status_code, check", SHIPPING_CHARGE_CASES)
+    async def test_shipping_charge(self, client, params, status_code, check):
+        """Each case returns the expected status and response fields."""
+        response = await client.get(
             "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "express"
-            }
+            params={**DEFAULT_SHIPPING_PARAMS, **params}
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["breakdown"]["deliveryCost"]["speed"] == "express"
-        assert data["breakdown"]["deliveryCost"]["extraCharge"] > 0
+        assert response.status_code == status_code
+        assert check(json_body(response))
     
-    def test_express_costs_more_than_standard(self, client):
-        """Express delivery should cost more than standard."""
-        standard = client.get(
+    async def test_amounts_rounded_in_response(self, client):
+        """Breakdown amounts are rounded only when serialized."""
+        response = await client.get(
             "/api/v1/shipping-charge",
             params={
                 "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        ).json()
-        
-        express = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
+                "customerId": 2,
+                "productId": 2,
                 "deliverySpeed": "express"
             }
-        ).json()
-        
-        assert express["shippingCharge"] > standard["shippingCharge"]
-    
-    def test_warehouse_not_found(self, client):
-        """Test error when warehouse doesn't exist."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 9999,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
         )
         
-        assert response.status_code == 404
-        assert "Warehouse" in response.json()["message"]
-    
-    def test_customer_not_found(self, client):
-        """Test error when customer doesn't exist."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 9999,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
-        
-        assert response.status_code == 404
-        assert "Customer" in response.json()["message"]
-    
-    def test_invalid_delivery_speed(self, client):
-        """Test error for invalid delivery speed."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "superfast"  # Invalid
-            }
-        )
-        
-        assert response.status_code == 400
-        assert "Invalid delivery speed" in response.json()["message"]
+        data = json_body(response)
+        assert data["breakdown"]["distanceKm"] == 920.74
+        assert data["breakdown"]["transportCost"] == 4143.34
+        assert data["breakdown"]["deliveryCost"]["total"] == 15.4
+        # Rounded once from the unrounded parts, not from the rounded ones
+        assert data["shippingCharge"] == 4158.74
 
 
 class TestCalculateTotalShippingAPI:
     """Test POST /api/v1/shipping-charge/calculate endpoint."""
     
-    def test_success(self, client):
+    async def test_success(self, client):
         """Test successful total shipping calculation."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/shipping-charge/calculate",
             json={
                 "sellerId": 1,
@@ -197,15 +230,15 @@ class TestCalculateTotalShippingAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert "shippingCharge" in data
         assert "nearestWarehouse" in data
         assert "breakdown" in data
         assert data["nearestWarehouse"]["warehouseId"] > 0
     
-    def test_express_delivery(self, client):
+    async def test_express_delivery(self, client):
         """Test with express delivery."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/shipping-charge/calculate",
             json={
                 "sellerId": 1,
@@ -216,44 +249,12 @@ class TestCalculateTotalShippingAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["breakdown"]["deliveryCost"]["speed"] == "express"
     
-    def test_different_sellers_get_different_warehouses(self, client):
-        """Different sellers may get different nearest warehouses."""
-        # Seller 1 is in Mumbai
-        response1 = client.post(
-            "/api/v1/shipping-charge/calculate",
-            json={
-                "sellerId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
-        
-        # Seller 2 is in Delhi
-        response2 = client.post(
-            "/api/v1/shipping-charge/calculate",
-            json={
-                "sellerId": 2,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
-        
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        
-        # They should get different warehouses
-        wh1 = response1.json()["nearestWarehouse"]["warehouseId"]
-        wh2 = response2.json()["nearestWarehouse"]["warehouseId"]
-        assert wh1 != wh2
-    
-    def test_seller_not_found(self, client):
+    async def test_seller_not_found(self, client):
         """Test error when seller doesn't exist."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/shipping-charge/calculate",
             json={
                 "sellerId": 9999,
@@ -265,9 +266,9 @@ class TestCalculateTotalShippingAPI:
         
         assert response.status_code == 404
     
-    def test_missing_required_fields(self, client):
+    async def test_missing_required_fields(self, client):
         """Test validation error for missing fields."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/shipping-charge/calculate",
             json={
                 "sellerId": 1
@@ -277,9 +278,9 @@ class TestCalculateTotalShippingAPI:
         
         assert response.status_code == 422
     
-    def test_default_delivery_speed(self, client):
+    async def test_default_delivery_speed(self, client):
         """Test that deliverySpeed defaults to standard."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/shipping-charge/calculate",
             json={
                 "sellerId": 1,
@@ -290,90 +291,45 @@ class TestCalculateTotalShippingAPI:
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["breakdown"]["deliveryCost"]["speed"] == "standard"
 
 
-class TestTransportModeSelection:
-    """Test that correct transport modes are selected based on distance."""
-    
-    def test_short_distance_uses_mini_van(self, client):
-        """Short distances should use Mini Van."""
-        # Seller 3 (Bangalore) to Customer 5 (Hyderabad) ~575km → Aeroplane
-        # But Warehouse 3 (Bangalore) to Customer 5 (Hyderabad) ~575km → Aeroplane
-        # Need to find a short distance combo
-        # Seller 1 (Mumbai) uses Warehouse 1 (Mumbai)
-        # Warehouse 1 (Mumbai) to Customer 1 (Pune) ~120km → Truck
-        pass  # Covered in other tests
+class TestBatchShippingAPI:
+    """Test POST /api/v1/shipping-charge/batch endpoint."""
     
-    def test_medium_distance_uses_truck(self, client):
-        """Medium distances should use Truck."""
-        # Warehouse 1 (Mumbai) to Customer 1 (Pune) ~120km
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
+    async def test_matches_single_calculation(self, client):
+        """Each batch result equals the single calculate response."""
+        items = [
+            {"sellerId": 1, "customerId": 1, "productId": 1, "deliverySpeed": "standard"},
+            {"sellerId": 2, "customerId": 3, "productId": 2, "deliverySpeed": "express"},
+            {"sellerId": 3, "customerId": 2, "productId": 3},
+        ]
         
-        assert response.status_code == 200
-        assert response.json()["breakdown"]["transportMode"] == "Truck"
-    
-    def test_long_distance_uses_aeroplane(self, client):
-        """Long distances should use Aeroplane."""
-        # Warehouse 1 (Mumbai) to Customer 4 (Kochi) ~1350km
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 4,
-                "productId": 1,
-                "deliverySpeed": "standard"
-            }
-        )
+        response = await client.post("/api/v1/shipping-charge/batch", json={"items": items})
         
         assert response.status_code == 200
-        assert response.json()["breakdown"]["transportMode"] == "Aeroplane"
-
-
-class TestEdgeCases:
-    """Test edge cases and error scenarios."""
+        results = json_body(response)["results"]
+        assert len(results) == len(items)
+        for item, result in zip(items, results):
+            single = await client.post("/api/v1/shipping-charge/calculate", json=item)
+            assert result == json_body(single)
     
-    def test_heavy_product_shipping(self, client):
-        """Test shipping for heavy product (10kg wheat flour)."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 3,  # 10kg wheat flour
-                "deliverySpeed": "express"
-            }
+    async def test_unknown_entity(self, client):
+        """A missing entity in any row fails the whole batch with 404."""
+        response = await client.post(
+            "/api/v1/shipping-charge/batch",
+            json={"items": [
+                {"sellerId": 1, "customerId": 1, "productId": 1},
+                {"sellerId": 999, "customerId": 1, "productId": 1},
+            ]}
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["breakdown"]["weightKg"] == 10.0
-        # Express extra charge = 1.2 * 10 = 12
-        assert data["breakdown"]["deliveryCost"]["extraCharge"] == 12.0
+        assert response.status_code == 404
+        assert json_body(response)["error"] == "NotFoundError"
     
-    def test_light_product_shipping(self, client):
-        """Test shipping for light product (0.5kg tea)."""
-        response = client.get(
-            "/api/v1/shipping-charge",
-            params={
-                "warehouseId": 1,
-                "customerId": 1,
-                "productId": 5,  # 0.5kg tea
-                "deliverySpeed": "express"
-            }
-        )
+    async def test_empty_batch(self, client):
+        """An empty item list is rejected."""
+        response = await client.post("/api/v1/shipping-charge/batch", json={"items": []})
         
-        assert response.status_code == 200
-        data = response.json()
-        assert data["breakdown"]["weightKg"] == 0.5
-        # Express extra charge = 1.2 * 0.5 = 0.6
-        assert data["breakdown"]["deliveryCost"]["extraCharge"] == 0.6
+        assert response.status_code == 422
@@ -1,6 +1,7 @@
 """
 Unit tests for the Haversine distance calculator.
 """
+import numpy as np
 import pytest
 from src.services.distance_calculator import DistanceCalculator
 from src.entities.location import Location
@@ -15,45 +16,22 @@ class TestDistanceCalculator:
         distance = DistanceCalculator.calculate(loc, loc)
         assert distance == 0.0
     
-    def test_mumbai_to_delhi(self):
-        """Test known distance: Mumbai to Delhi is ~1153 km."""
-        mumbai = Location(lat=19.0760, lng=72.8777)
-        delhi = Location(lat=28.7041, lng=77.1025)
-        
-        distance = DistanceCalculator.calculate(mumbai, delhi)
-        
-        # Allow 5% tolerance for Haversine approximation
-        assert 1090 < distance < 1210
-    
-    def test_bangalore_to_chennai(self):
-        """Test known distance: Bangalore to Chennai is ~290 km."""
-        bangalore = Location(lat=12.9716, lng=77.5946)
-        chennai = Location(lat=13.0827, lng=80.2707)
-        
-        distance = DistanceCalculator.calculate(bangalore, chennai)
-        
-        # Allow tolerance
-        assert 275 < distance < 310
-    
-    def test_short_distance(self):
-        """Test very short distance (within a city)."""
-        # Andheri to Bandra in Mumbai (~10 km)
-        andheri = Location(lat=19.1136, lng=72.8697)
-        bandra = Location(lat=19.0544, lng=72.8402)
-        
-        distance = DistanceCalculator.calculate(andheri, bandra)
-        
-        assert 5 < distance < 15
-    
-    def test_long_distance_across_india(self):
-        """Test long distance: Delhi to Kochi is ~2000+ km."""
-        delhi = Location(lat=28.7041, lng=77.1025)
-        kochi = Location(lat=9.9312, lng=76.2673)
-        
-        distance = DistanceCalculator.calculate(delhi, kochi)
+    # Loose bands around the real distances, which Haversine approximates
+    @pytest.mark.parametrize("point1, point2, low, high", [
+        pytest.param((19.0760, 72.8777), (28.7041, 77.1025), 1090, 1210, id="mumbai-delhi"),
+        pytest.param((12.9716, 77.5946), (13.0827, 80.2707), 275, 310, id="bangalore-chennai"),
+        pytest.param((19.1136, 72.8697), (19.0544, 72.8402), 5, 15, id="andheri-bandra"),
+        pytest.param((28.7041, 77.1025), (9.9312, 76.2673), 1900, 2200, id="delhi-kochi"),
+        pytest.param((10.0, 77.0), (-10.0, 77.0), 2100, 2350, id="equator-crossing"),
+    ])
+    def test_known_distance(self, point1, point2, low, high):
+        """Distances between known places fall within the expected band."""
+        distance = DistanceCalculator.calculate(
+            Location(lat=point1[0], lng=point1[1]),
+            Location(lat=point2[0], lng=point2[1])
+        )
         
-        assert distance > 1900
-        assert distance < 2200
+        assert low < distance < high
     
     def test_calculate_from_coords(self):
         """Test convenience method with raw coordinates."""
@@ -64,6 +42,10 @@ class TestDistanceCalculator:
         
         # Mumbai to Pune is ~120 km
         assert 100 < distance < 150
+        assert distance == pytest.approx(DistanceCalculator.calculate(
+            Location(lat=19.0760, lng=72.8777),
+            Location(lat=18.5204, lng=73.8567)
+        ))
     
     def test_symmetry(self):
         """Distance A→B should equal B→A."""
@@ -75,12 +57,31 @@ class TestDistanceCalculator:
         
         assert distance_ab == distance_ba
     
-    def test_equator_crossing(self):
-        """Test distance calculation crossing the equator."""
-        north = Location(lat=10.0, lng=77.0)
-        south = Location(lat=-10.0, lng=77.0)
+    def test_calculate_bulk_matches_scalar(self):
+        """Bulk distances should match the scalar calculation."""
+        origin = Location(lat=19.0760, lng=72.8777)  # Mumbai
+        targets = [
+            Location(lat=28.7041, lng=77.1025),  # Delhi
+            Location(lat=12.9716, lng=77.5946),  # Bangalore
+            Location(lat=19.0760, lng=72.8777),  # Mumbai
+        ]
         
-        distance = DistanceCalculator.calculate(north, south)
+        distances = DistanceCalculator.calculate_bulk(
+            origin.lat,
+            origin.lng,
+            np.array([t.lat for t in targets]),
+            np.array([t.lng for t in targets])
+        )
+        
+        expected = [DistanceCalculator.calculate(origin, t) for t in targets]
+        assert distances.tolist() == pytest.approx(expected, abs=0.01)
+    
+    def test_unchecked_location_has_radians(self):
+        """Unvalidated Locations still carry the precomputed radian values."""
+        checked = Location(lat=19.0760, lng=72.8777)
+        unchecked = Location.unchecked(19.0760, 72.8777)
         
-        # ~2222 km (20 degrees * 111 km/degree)
-        assert 2100 < distance < 2350
+        assert unchecked == checked
+        assert (unchecked.lat_rad, unchecked.lng_rad, unchecked.cos_lat) == (
+            checked.lat_rad, checked.lng_rad, checked.cos_lat
+        )
@@ -0,0 +1,142 @@
+"""
+Unit tests for in-memory repositories.
+"""
+from src.entities.customer import Customer
+from src.entities.location import Location
+from src.entities.product import Product
+from src.entities.seller import Seller
+from src.entities.warehouse import Warehouse
+from src.repositories.customer_repository import CustomerRepository
+from src.repositories.product_repository import ProductRepository
+from src.repositories.seller_repository import SellerRepository
+from src.repositories.warehouse_repository import WarehouseRepository
+
+
+class TestBaseRepository:
+    """Test suite for the shared BaseRepository behaviour."""
+    
+    def test_bulk_add(self):
+        """bulk_add stores every entity under its ID."""
+        repo = WarehouseRepository()
+        warehouses = [
+            Warehouse(warehouse_id=1, location=Location(lat=19.0760, lng=72.8777)),
+            Warehouse(warehouse_id=2, location=Location(lat=28.7041, lng=77.1025)),
+        ]
+        
+        repo.bulk_add(warehouses)
+        
+        assert repo.count() == 2
+        assert repo.get_by_id(2) is warehouses[1]
+    
+    def test_iter_all_is_live_view(self):
+        """iter_all reflects the store without copying it."""
+        repo = WarehouseRepository()
+        view = repo.iter_all()
+        
+        repo.add(Warehouse(warehouse_id=1, location=Location(lat=19.0760, lng=72.8777)))
+        
+        assert [w.warehouse_id for w in view] == [1]
+    
+    def test_bulk_add_refreshes_coordinates(self):
+        """Warehouse coordinate arrays include entities from bulk_add."""
+        repo = WarehouseRepository()
+        repo.add(Warehouse(warehouse_id=1, location=Location(lat=19.0760, lng=72.8777)))
+        assert len(repo.get_coordinates().warehouses) == 1
+        
+        repo.bulk_add([
+            Warehouse(warehouse_id=2, location=Location(lat=28.7041, lng=77.1025))
+        ])
+        
+        assert len(repo.get_coordinates().warehouses) == 2
+
+
+class TestCustomerRepository:
+    """Test suite for CustomerRepository."""
+    
+    def test_find_by_phone_follows_updates(self):
+        """The phone index tracks add, update and delete."""
+        repo = CustomerRepository()
+        location = Location(lat=19.0760, lng=72.8777)
+        repo.add(Customer(customer_id=1, name="A", phone="111", location=location))
+        
+        renamed = Customer(customer_id=1, name="A", phone="222", location=location)
+        repo.update(renamed)
+        
+        assert repo.find_by_phone("111") is None
+        assert repo.find_by_phone("222") is renamed
+        
+        repo.delete(1)
+        assert repo.find_by_phone("222") is None
+
+
+class TestProductRepository:
+    """Test suite for ProductRepository."""
+    
+    def test_range_queries_follow_updates(self):
+        """Price and weight indexes track add, update and delete."""
+        repo = ProductRepository()
+        repo.bulk_add([
+            Product(product_id=1, name="A", price=50.0, weight_kg=1.0),
+            Product(product_id=2, name="B", price=500.0, weight_kg=20.0),
+        ])
+        repo.add(Product(product_id=3, name="C", price=100.0, weight_kg=5.0))
+        
+        assert [p.product_id for p in repo.find_by_price_range(40, 200)] == [1, 3]
+        assert [p.product_id for p in repo.find_by_max_weight(5.0)] == [1, 3]
+        
+        repo.update(Product(product_id=3, name="C", price=1000.0, weight_kg=50.0))
+        repo.delete(1)
+        
+        assert repo.find_by_price_range(40, 200) == []
+        assert [p.product_id for p in repo.find_by_price_range(0, 5000)] == [2, 3]
+        assert repo.find_by_max_weight(5.0) == []
+    
+    def test_in_place_edit_then_update(self):
+        """A product mutated in place is re-indexed by update()."""
+        repo = ProductRepository()
+        repo.add(Product(product_id=1, name="A", price=50.0, weight_kg=1.0))
+        
+        product = repo.get_by_id(1)
+        product.price = 999.0
+        product.weight_kg = 30.0
+        repo.update(product)
+        
+        assert repo.find_by_price_range(0, 100) == []
+        assert repo.find_by_price_range(900, 1000) == [product]
+        assert repo.find_by_max_weight(5.0) == []
+        assert repo.find_by_max_weight(30.0) == [product]
+    
+    def test_in_place_edit_then_delete(self):
+        """A product mutated in place is fully removed by delete()."""
+        repo = ProductRepository()
+        repo.add(Product(product_id=1, name="A", price=50.0, weight_kg=1.0))
+        
+        repo.get_by_id(1).price = 999.0
+        
+        assert repo.delete(1) is True
+        assert repo.get_by_id(1) is None
+        assert repo.find_by_price_range(0, 1000) == []
+        assert repo.find_by_max_weight(100.0) == []
+
+
+class TestSellerRepository:
+    """Test suite for SellerRepository."""
+    
+    def test_find_by_name(self):
+        """Name search is case-insensitive, partial, and tracks updates."""
+        repo = SellerRepository()
+        location = Location(lat=19.0760, lng=72.8777)
+        repo.bulk_add([
+            Seller(seller_id=1, name="Shree Kirana Store", location=location),
+            Seller(seller_id=2, name="Om General Store", location=location),
+            Seller(seller_id=3, name="Ganesh Mart", location=location),
+        ])
+        
+        assert [s.seller_id for s in repo.find_by_name("STORE")] == [1, 2]
+        assert [s.seller_id for s in repo.find_by_name("om")] == [2]
+        
+        repo.update(Seller(seller_id=3, name="Ganesh Store", location=location))
+        repo.delete(1)
+        
+        assert [s.seller_id for s in repo.find_by_name("store")] == [2, 3]
+        assert repo.find_by_name("mart") == []
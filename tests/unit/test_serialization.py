@@ -0,0 +1,62 @@
+"""
+Unit tests for entity JSON serialization.
+"""
+import orjson
+import pytest
+from src.entities.serialization import dumps
+from src.entities.customer import Customer
+from src.entities.location import Location
+from src.entities.product import Dimensions, Product
+from src.entities.warehouse import Warehouse
+
+
+class TestEntitySerialization:
+    """Test suite for the orjson entity encoder."""
+    
+    def test_nested_location(self):
+        """Nested entities are encoded with their public field names."""
+        customer = Customer(
+            customer_id=1,
+            name="Rahul Verma",
+            phone="+91-9876543210",
+            location=Location(lat=18.5204, lng=73.8567)
+        )
+        
+        data = orjson.loads(dumps(customer))
+        
+        assert data == {
+            "customerId": 1,
+            "name": "Rahul Verma",
+            "phone": "+91-9876543210",
+            "location": {"lat": 18.5204, "long": 73.8567}
+        }
+    
+    def test_warehouse(self):
+        """Warehouse location is exposed as warehouseLocation."""
+        warehouse = Warehouse(warehouse_id=1, location=Location(lat=19.076, lng=72.8777))
+        
+        data = orjson.loads(dumps(warehouse))
+        
+        assert data["warehouseId"] == 1
+        assert data["warehouseLocation"] == {"lat": 19.076, "long": 72.8777}
+    
+    def test_product_dimensions_optional(self):
+        """Dimensions are only included when present."""
+        plain = Product(product_id=1, name="Sugar", price=90.0, weight_kg=2.0)
+        boxed = Product(
+            product_id=2,
+            name="Rice",
+            price=350.0,
+            weight_kg=5.0,
+            dimensions=Dimensions(length=30, width=20, height=10)
+        )
+        
+        data = orjson.loads(dumps([plain, boxed]))
+        
+        assert "dimensions" not in data[0]
+        assert data[1]["dimensions"] == {"length": 30, "width": 20, "height": 10}
+    
+    def test_unknown_type_raises(self):
+        """Objects that are not entities are rejected."""
+        with pytest.raises(TypeError):
+            dumps(object())
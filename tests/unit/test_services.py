@@ -1,9 +1,22 @@
 """
 Unit tests for services.
 """
+import numpy as np
 import pytest
-from src.services.shipping_charge_service import DeliverySpeed
+from src.services.shipping_charge_service import DeliverySpeed, ShippingChargeService
+from src.services.batch_shipping import BatchShippingService
 from src.core.exceptions import NotFoundError, ValidationError
+from src.services.warehouse_service import WarehouseService
+from src.services.distance_calculator import DistanceCalculator
+from src.repositories.warehouse_repository import WarehouseRepository
+from src.repositories.seller_repository import SellerRepository
+from src.repositories.customer_repository import CustomerRepository
+from src.repositories.product_repository import ProductRepository
+from src.core.dependencies import Repositories
+from src.data.seed import seed_data
+from src.entities.location import Location
+from src.entities.seller import Seller
+from src.entities.warehouse import Warehouse
 
 
 class TestWarehouseService:
@@ -23,6 +36,72 @@ class TestWarehouseService:
         with pytest.raises(NotFoundError, match="Seller with ID 999 not found"):
             services.warehouse.find_nearest_warehouse(seller_id=999)
     
+    def test_new_warehouse_is_considered(self):
+        """A warehouse added after a lookup is used by the next lookup."""
+        warehouse_repo = WarehouseRepository()
+        seller_repo = SellerRepository()
+        seller_repo.add(
+            Seller(seller_id=1, name="Test Store", location=Location(lat=19.1136, lng=72.8697))
+        )
+        warehouse_repo.add(
+            Warehouse(warehouse_id=1, location=Location(lat=28.7041, lng=77.1025))
+        )
+        service = WarehouseService(warehouse_repo=warehouse_repo, seller_repo=seller_repo)
+        
+        warehouse, _ = service.find_nearest_warehouse(seller_id=1)
+        assert warehouse.warehouse_id == 1
+        
+        # Warehouse at the seller's own location
+        warehouse_repo.add(
+            Warehouse(warehouse_id=2, location=Location(lat=19.1136, lng=72.8697))
+        )
+        warehouse, distance = service.find_nearest_warehouse(seller_id=1)
+        
+        assert warehouse.warehouse_id == 2
+        assert distance == 0.0
+    
+    def test_matches_brute_force_search(self):
+        """The k-d tree lookup agrees with a full Haversine scan."""
+        rng = np.random.default_rng(7)
+        lats = rng.uniform(-80, 80, 200)
+        lngs = rng.uniform(-180, 180, 200)
+        warehouse_repo = WarehouseRepository()
+        seller_repo = SellerRepository()
+        warehouse_repo.bulk_add([
+            Warehouse(warehouse_id=i + 1, location=Location(lat=lat, lng=lng))
+            for i, (lat, lng) in enumerate(zip(lats, lngs))
+        ])
+        seller_repo.add(
+            Seller(seller_id=1, name="Test Store", location=Location(lat=12.5, lng=-40.0))
+        )
+        service = WarehouseService(warehouse_repo=warehouse_repo, seller_repo=seller_repo)
+        
+        warehouse, _ = service.find_nearest_warehouse(seller_id=1)
+        
+        distances = DistanceCalculator.calculate_bulk(12.5, -40.0, lats, lngs)
+        assert warehouse.warehouse_id == int(np.argmin(distances)) + 1
+    
+    def test_moved_seller_is_recomputed(self):
+        """Updating a seller invalidates its cached nearest warehouse."""
+        warehouse_repo = WarehouseRepository()
+        seller_repo = SellerRepository()
+        warehouse_repo.bulk_add([
+            Warehouse(warehouse_id=1, location=Location(lat=19.1136, lng=72.8697)),
+            Warehouse(warehouse_id=2, location=Location(lat=28.7041, lng=77.1025)),
+        ])
+        seller_repo.add(
+            Seller(seller_id=1, name="Test Store", location=Location(lat=19.1136, lng=72.8697))
+        )
+        service = WarehouseService(warehouse_repo=warehouse_repo, seller_repo=seller_repo)
+        
+        assert service.find_nearest_warehouse(seller_id=1)[0].warehouse_id == 1
+        
+        seller_repo.update(
+            Seller(seller_id=1, name="Test Store", location=Location(lat=28.7041, lng=77.1025))
+        )
+        
+        assert service.find_nearest_warehouse(seller_id=1)[0].warehouse_id == 2
+    
     def test_get_warehouse(self, services):
         """Test getting warehouse by ID."""
         warehouse = services.warehouse.get_warehouse(warehouse_id=1)
@@ -54,6 +133,24 @@ class TestShippingChargeService:
         assert result.delivery_cost.base_charge == 10.0
         assert result.delivery_cost.extra_charge == 0.0
     
+    def test_charge_rounded_once_from_unrounded_parts(self, services):
+        """Only the total is rounded; distance and costs keep full precision."""
+        result = services.shipping_charge.calculate_from_warehouse(
+            warehouse_id=1,  # Mumbai
+            customer_id=2,   # Jaipur (~920 km)
+            product_id=2,    # Cooking oil 4.5kg
+            delivery_speed="express"
+        )
+        
+        assert result.distance_km != round(result.distance_km, 2)
+        assert result.transport_cost != round(result.transport_cost, 2)
+        assert result.transport_cost == result.distance_km * 1 * result.weight_kg
+        assert result.shipping_charge == round(
+            result.transport_cost + result.delivery_cost.total, 2
+        )
+        # Rounding the parts first would give 4158.73
+        assert result.shipping_charge == 4158.74
+    
     def test_calculate_from_warehouse_express(self, services):
         """Test shipping calculation with express delivery."""
         result = services.shipping_charge.calculate_from_warehouse(
@@ -67,6 +164,20 @@ class TestShippingChargeService:
         assert result.delivery_cost.base_charge == 10.0
         assert result.delivery_cost.extra_charge == 6.0  # 1.2 * 5kg
     
+    def test_express_costs_more_than_standard(self, services):
+        """Express delivery should cost more than standard."""
+        standard = services.shipping_charge.calculate_from_warehouse(1, 1, 1, "standard")
+        express = services.shipping_charge.calculate_from_warehouse(1, 1, 1, "express")
+        
+        assert express.shipping_charge > standard.shipping_charge
+    
+    def test_delivery_cost_is_shared(self, services):
+        """Repeated (speed, weight) pairs reuse the cached DeliveryCost."""
+        first = services.shipping_charge.calculate_from_warehouse(1, 1, 1, "express")
+        second = services.shipping_charge.calculate_from_warehouse(2, 2, 1, "express")
+        
+        assert first.delivery_cost is second.delivery_cost
+    
     def test_invalid_delivery_speed(self, services):
         """Test error for invalid delivery speed."""
         with pytest.raises(ValidationError, match="Invalid delivery speed"):
@@ -121,6 +232,52 @@ class TestShippingChargeService:
         assert result.nearest_warehouse.warehouse_id == 1  # Mumbai warehouse
         assert result.breakdown is not None
     
+    def test_different_sellers_get_different_warehouses(self, services):
+        """Sellers in different cities ship from different warehouses."""
+        # Seller 1 is in Mumbai, seller 2 in Delhi
+        mumbai = services.shipping_charge.calculate_total(1, 1, 1, "standard")
+        delhi = services.shipping_charge.calculate_total(2, 1, 1, "standard")
+        
+        assert (
+            mumbai.nearest_warehouse.warehouse_id
+            != delhi.nearest_warehouse.warehouse_id
+        )
+    
+    def test_calculate_total_reuses_cached_quote(self, services):
+        """Repeated calculate_total calls share one breakdown."""
+        first = services.shipping_charge.calculate_total(1, 1, 1, "standard")
+        second = services.shipping_charge.calculate_total(1, 1, 1, "STANDARD")
+        
+        assert second.breakdown is first.breakdown
+    
+    def test_quote_cache_follows_product_updates(self):
+        """Updating a product drops cached quotes that used its weight."""
+        repositories = Repositories(
+            customer=CustomerRepository(),
+            seller=SellerRepository(),
+            product=ProductRepository(),
+            warehouse=WarehouseRepository()
+        )
+        seed_data(repositories)
+        service = ShippingChargeService(
+            warehouse_repo=repositories.warehouse,
+            customer_repo=repositories.customer,
+            product_repo=repositories.product,
+            warehouse_service=WarehouseService(
+                warehouse_repo=repositories.warehouse,
+                seller_repo=repositories.seller
+            )
+        )
+        before = service.calculate_total(1, 1, 1, "standard")
+        
+        product = repositories.product.get_by_id(1)
+        product.weight_kg *= 2
+        repositories.product.update(product)
+        after = service.calculate_total(1, 1, 1, "standard")
+        
+        assert after.breakdown.weight_kg == 2 * before.breakdown.weight_kg
+        assert after.shipping_charge > before.shipping_charge
+    
     def test_different_transport_modes(self, services):
         """Test that different distances use different transport modes."""
         # Short distance: Mumbai warehouse to Pune customer (~120 km) = Truck
@@ -136,6 +293,69 @@ class TestShippingChargeService:
         assert result2.transport_mode == "Aeroplane"
 
 
+class TestBatchShippingService:
+    """Test suite for BatchShippingService."""
+    
+    def test_matches_single_calculation(self, services):
+        """Every batch row equals the corresponding calculate_total result."""
+        rows = [
+            (1, 1, 1, "standard"),
+            (2, 2, 2, "express"),
+            (3, 3, 3, "EXPRESS"),
+            (1, 3, 2, "standard"),
+        ]
+        
+        result = services.batch_shipping.calculate_total_batch(*zip(*rows))
+        
+        for i, row in enumerate(rows):
+            single = services.shipping_charge.calculate_total(*row)
+            assert result.nearest_warehouses[i] is single.nearest_warehouse
+            assert result.distances_km[i] == single.distance_km
+            assert result.transport_modes[i] == single.breakdown.transport_mode
+            assert result.transport_costs[i] == single.breakdown.transport_cost
+            assert result.delivery_costs[i] == single.breakdown.delivery_cost
+            assert result.shipping_charges[i] == single.shipping_charge
+    
+    def test_uses_charges_of_injected_service(self, repositories, services):
+        """Overridden courier charges apply to batch rows too."""
+        class PremiumShippingChargeService(ShippingChargeService):
+            BASE_COURIER_CHARGE = 25.0
+            EXPRESS_EXTRA_PER_KG = 3.0
+        
+        shipping_charge = PremiumShippingChargeService(
+            warehouse_repo=repositories.warehouse,
+            customer_repo=repositories.customer,
+            product_repo=repositories.product,
+            warehouse_service=services.warehouse
+        )
+        batch_shipping = BatchShippingService(
+            customer_repo=repositories.customer,
+            product_repo=repositories.product,
+            warehouse_service=services.warehouse,
+            shipping_charge_service=shipping_charge
+        )
+        
+        result = batch_shipping.calculate_total_batch([2], [2], [2], ["express"])
+        single = shipping_charge.calculate_total(2, 2, 2, "express")
+        
+        assert result.delivery_costs[0].base_charge == 25.0
+        assert result.shipping_charges[0] == single.shipping_charge
+    
+    def test_mismatched_lengths(self, services):
+        """Input sequences must all have the same length."""
+        with pytest.raises(ValidationError, match="same length"):
+            services.batch_shipping.calculate_total_batch(
+                [1, 2], [1], [1, 2], ["standard", "standard"]
+            )
+    
+    def test_missing_customer(self, services):
+        """An unknown entity in any row raises NotFoundError."""
+        with pytest.raises(NotFoundError, match="Customer"):
+            services.batch_shipping.calculate_total_batch(
+                [1, 1], [1, 999], [1, 1], ["standard", "standard"]
+            )
+
+
 class TestDeliverySpeed:
     """Test DeliverySpeed enum."""
     
@@ -1,6 +1,7 @@
 """
 Unit tests for shipping strategies.
 """
+from dataclasses import FrozenInstanceError
 import pytest
 from src.strategies import (
     MiniVanStrategy,
@@ -10,66 +11,89 @@ from src.strategies import (
 )
 
 
+# Strategies and the factory are stateless, so one instance per module
+# serves every test
+@pytest.fixture(scope="module")
+def factory():
+    """Shared ShippingStrategyFactory."""
+    return ShippingStrategyFactory()
+
+
+@pytest.fixture(scope="module")
+def mini_van():
+    """Shared MiniVanStrategy."""
+    return MiniVanStrategy()
+
+
+@pytest.fixture(scope="module")
+def truck():
+    """Shared TruckStrategy."""
+    return TruckStrategy()
+
+
+@pytest.fixture(scope="module")
+def aeroplane():
+    """Shared AeroplaneStrategy."""
+    return AeroplaneStrategy()
+
+
 class TestMiniVanStrategy:
     """Test suite for MiniVanStrategy."""
     
-    def test_properties(self):
+    def test_properties(self, mini_van):
         """Test strategy properties."""
-        strategy = MiniVanStrategy()
-        assert strategy.min_distance == 0
-        assert strategy.max_distance == 100
-        assert strategy.rate_per_km_per_kg == 3.0
-        assert strategy.mode_name == "Mini Van"
+        assert mini_van.min_distance == 0
+        assert mini_van.max_distance == 100
+        assert mini_van.rate_per_km_per_kg == 3.0
+        assert mini_van.mode_name == "Mini Van"
     
-    def test_applicability(self):
+    def test_applicability(self, mini_van):
         """Test distance range applicability."""
-        strategy = MiniVanStrategy()
-        
-        assert strategy.is_applicable(0)
-        assert strategy.is_applicable(50)
-        assert strategy.is_applicable(99.9)
-        assert not strategy.is_applicable(100)
-        assert not strategy.is_applicable(150)
+        assert mini_van.is_applicable(0)
+        assert mini_van.is_applicable(50)
+        assert mini_van.is_applicable(99.9)
+        assert not mini_van.is_applicable(100)
+        assert not mini_van.is_applicable(150)
     
-    def test_cost_calculation(self):
+    def test_cost_calculation(self, mini_van):
         """Test cost calculation."""
-        strategy = MiniVanStrategy()
-        
         # 50 km, 2 kg → 50 * 3 * 2 = 300 INR
-        result = strategy.calculate_cost(distance_km=50, weight_kg=2)
+        result = mini_van.calculate_cost(distance_km=50, weight_kg=2)
         
         assert result.transport_cost == 300.0
         assert result.transport_mode == "Mini Van"
         assert result.rate_per_km_per_kg == 3.0
+    
+    def test_cost_result_is_immutable(self, mini_van):
+        """Cost results are frozen values."""
+        result = mini_van.calculate_cost(distance_km=50, weight_kg=2)
+        
+        with pytest.raises(FrozenInstanceError):
+            result.transport_cost = 0.0
 
 
 class TestTruckStrategy:
     """Test suite for TruckStrategy."""
     
-    def test_properties(self):
+    def test_properties(self, truck):
         """Test strategy properties."""
-        strategy = TruckStrategy()
-        assert strategy.min_distance == 100
-        assert strategy.max_distance == 500
-        assert strategy.rate_per_km_per_kg == 2.0
-        assert strategy.mode_name == "Truck"
+        assert truck.min_distance == 100
+        assert truck.max_distance == 500
+        assert truck.rate_per_km_per_kg == 2.0
+        assert truck.mode_name == "Truck"
     
-    def test_applicability(self):
+    def test_applicability(self, truck):
         """Test distance range applicability."""
-        strategy = TruckStrategy()
-        
-        assert not strategy.is_applicable(99)
-        assert strategy.is_applicable(100)
-        assert strategy.is_applicable(250)
-        assert strategy.is_applicable(499.9)
-        assert not strategy.is_applicable(500)
+        assert not truck.is_applicable(99)
+        assert truck.is_applicable(100)
+        assert truck.is_applicable(250)
+        assert truck.is_applicable(499.9)
+        assert not truck.is_applicable(500)
     
-    def test_cost_calculation(self):
+    def test_cost_calculation(self, truck):
         """Test cost calculation."""
-        strategy = TruckStrategy()
-        
         # 200 km, 5 kg → 200 * 2 * 5 = 2000 INR
-        result = strategy.calculate_cost(distance_km=200, weight_kg=5)
+        result = truck.calculate_cost(distance_km=200, weight_kg=5)
         
         assert result.transport_cost == 2000.0
         assert result.transport_mode == "Truck"
@@ -78,28 +102,23 @@ class TestTruckStrategy:
 class TestAeroplaneStrategy:
     """Test suite for AeroplaneStrategy."""
     
-    def test_properties(self):
+    def test_properties(self, aeroplane):
         """Test strategy properties."""
-        strategy = AeroplaneStrategy()
-        assert strategy.min_distance == 500
-        assert strategy.rate_per_km_per_kg == 1.0
-        assert strategy.mode_name == "Aeroplane"
+        assert aeroplane.min_distance == 500
+        assert aeroplane.rate_per_km_per_kg == 1.0
+        assert aeroplane.mode_name == "Aeroplane"
     
-    def test_applicability(self):
+    def test_applicability(self, aeroplane):
         """Test distance range applicability."""
-        strategy = AeroplaneStrategy()
-        
-        assert not strategy.is_applicable(499)
-        assert strategy.is_applicable(500)
-        assert strategy.is_applicable(1000)
-        assert strategy.is_applicable(5000)
+        assert not aeroplane.is_applicable(499)
+        assert aeroplane.is_applicable(500)
+        assert aeroplane.is_applicable(1000)
+        assert aeroplane.is_applicable(5000)
     
-    def test_cost_calculation(self):
+    def test_cost_calculation(self, aeroplane):
         """Test cost calculation."""
-        strategy = AeroplaneStrategy()
-        
         # 1000 km, 3 kg → 1000 * 1 * 3 = 3000 INR
-        result = strategy.calculate_cost(distance_km=1000, weight_kg=3)
+        result = aeroplane.calculate_cost(distance_km=1000, weight_kg=3)
         
         assert result.transport_cost == 3000.0
         assert result.transport_mode == "Aeroplane"
@@ -108,57 +127,30 @@ class TestAeroplaneStrategy:
 class TestShippingStrategyFactory:
     """Test suite for ShippingStrategyFactory."""
     
-    def test_get_mini_van_for_short_distance(self):
-        """Factory returns MiniVan for 0-100 km."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(50)
-        
-        assert isinstance(strategy, MiniVanStrategy)
-    
-    def test_get_truck_for_medium_distance(self):
-        """Factory returns Truck for 100-500 km."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(250)
-        
-        assert isinstance(strategy, TruckStrategy)
-    
-    def test_get_aeroplane_for_long_distance(self):
-        """Factory returns Aeroplane for 500+ km."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(800)
-        
-        assert isinstance(strategy, AeroplaneStrategy)
-    
-    def test_boundary_100km(self):
-        """Test boundary at 100 km (should be Truck)."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(100)
-        
-        assert isinstance(strategy, TruckStrategy)
-    
-    def test_boundary_500km(self):
-        """Test boundary at 500 km (should be Aeroplane)."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(500)
-        
-        assert isinstance(strategy, AeroplaneStrategy)
-    
-    def test_negative_distance_raises_error(self):
+    @pytest.mark.parametrize("distance_km, expected", [
+        (0, MiniVanStrategy),
+        (50, MiniVanStrategy),
+        (100, TruckStrategy),  # boundary: 100 km is Truck
+        (250, TruckStrategy),
+        (500, AeroplaneStrategy),  # boundary: 500 km is Aeroplane
+        (800, AeroplaneStrategy),
+    ])
+    def test_get_strategy(self, factory, distance_km, expected):
+        """Factory returns the strategy covering each distance band."""
+        strategy = factory.get_strategy(distance_km)
+        
+        # Strategies are @final leaf classes, so an exact type check suffices
+        assert type(strategy) is expected
+    
+    def test_negative_distance_raises_error(self, factory):
         """Negative distance should raise ValueError."""
-        factory = ShippingStrategyFactory()
-        
         with pytest.raises(ValueError, match="cannot be negative"):
             factory.get_strategy(-10)
     
-    def test_zero_distance(self):
-        """Zero distance should return MiniVan."""
-        factory = ShippingStrategyFactory()
-        
-        strategy = factory.get_strategy(0)
-        
-        assert isinstance(strategy, MiniVanStrategy)
+    def test_get_rate_matches_strategy(self, factory):
+        """get_rate returns the selected strategy's mode and rate."""
+        for distance in (0, 50, 100, 250, 500, 800):
+            strategy = factory.get_strategy(distance)
+            assert factory.get_rate(distance) == (
+                strategy.mode_name, strategy.rate_per_km_per_kg
+            )